@@ -0,0 +1,75 @@
+"""
+Zenginleştirme kuralları: eski if-zinciri vs derlenmiş kural tablosu (modules/rules.RuleEngine).
+
+    python Scripts/benchmarks/bench_enrichment.py [--sizes 10000 100000] [--runs 5]
+
+Girdi, veritabanındaki (code, name, platform) üçlülerinden tekrarla büyütülür.
+Sonuçlar karşılaştırılır; products sırası eski sürümde set sırasına bağlı olduğu için küme olarak.
+Toplu değerlendirme ayrıca ASCII olmayan isimlerle (büyük/küçük harfte uzunluğu değişen) tek kayıt yoluna karşı denetlenir.
+"""
+import argparse
+
+from common import load_records, median_ms
+from modules.rules import load_rules
+
+def legacy_severity(code, name, platform):
+    name_u = name.upper()
+    if "SUCCESS" in name_u or "OK" in name_u or "INFO" in name_u: return "Info"
+    if "WARNING" in name_u or "PENDING" in name_u: return "Warning"
+    if "FATAL" in name_u or "CRITICAL" in name_u or "PANIC" in name_u or platform == "bsod": return "Critical"
+    return "Error"
+
+def legacy_products(code_hex, name, platform):
+    products = set()
+    safe_name = name if name else ""
+    code_clean = code_hex.lower().replace('0x', '')
+    if platform == "linux": return ["Linux Kernel"]
+    if platform == "web": return ["Web/API"]
+    if platform == "smtp": return ["Exchange/Postfix"]
+    if platform == "database": return ["PostgreSQL/SQL"]
+    if platform == "container": return ["Docker/K8s"]
+    if platform == "bsod": return ["BSOD/Crash", "Kernel"]
+    if safe_name.startswith("STATUS_") or safe_name.startswith("BUGCODE_"): products.add("Kernel/Driver")
+    if code_clean.startswith("800f") or code_clean.startswith("8024") or "cbs" in safe_name.lower() or "wu_" in safe_name.lower():
+        products.add("Windows Update"); products.add("DISM/CBS")
+    if safe_name.startswith("WSA") or (code_clean.startswith("27") and len(code_clean) == 4):
+        products.add("Winsock/TCP"); products.add("Network")
+    if not products: products.add("System")
+    return list(products)
+
+def legacy_batch(items):
+    return [(legacy_severity(code, name, platform), legacy_products(code, name, platform)) for code, name, platform in items]
+
+# upper()/lower() ile uzunluğu değişen karakterler: ofset kayması sonraki kayıtlara yanlış kural yazdırır.
+NON_ASCII_NAMES = ["ßßßßßß", "OK", "ABCDEFGH", "ﬁle_WARNING", "İNFO_İ", "STATUS_ß_PENDING", "Straße_FATAL", "WSA_ǅ"]
+
+def check_single(engine, base):
+    """evaluate_batch, evaluate() ile aynı sonucu veriyor mu (isimler ASCII olmayan karakterlerle karıştırılır)."""
+    items = [(code, NON_ASCII_NAMES[i % len(NON_ASCII_NAMES)] if i % 3 == 0 else name, platform) for i, (code, name, platform) in enumerate(base)]
+    items += [("0xİ" + code, name, platform) for code, name, platform in base[:200]]
+    return sum(1 for item, result in zip(items, engine.evaluate_batch(items)) if engine.evaluate(*item) != result), len(items)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    records = load_records()
+    base = [(str(obj["code"]), obj.get("name") or "", obj.get("platform", "windows")) for obj in records]
+    engine = load_rules()
+    print(f"[*] {len(base)} records, {len(engine.rules)} rules")
+    bad, total = check_single(engine, base[:3000])
+    print(f"[*] batch vs single-record path (non-ASCII names): {bad}/{total} mismatches")
+    print(f"{'records':>10}{'legacy ms':>12}{'engine ms':>12}{'speedup':>10}{'mismatch':>10}")
+    for n in args.sizes:
+        items = (base * (n // len(base) + 1))[:n]
+        old = legacy_batch(items)
+        new = engine.evaluate_batch(items)
+        mismatch = sum(1 for (s1, p1), (s2, p2) in zip(old, new) if s1 != s2 or set(p1) != set(p2))
+        t_old = median_ms(lambda: legacy_batch(items), args.runs)
+        t_new = median_ms(lambda: engine.evaluate_batch(items), args.runs)
+        print(f"{n:>10}{t_old:>12.1f}{t_new:>12.1f}{t_old / t_new:>9.2f}x{mismatch:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Fuzzy eşleme: fuzzy-index.json (SymSpell silme sözlüğü) vs tüm kayıtlarda kaba kuvvet Levenshtein.
+
+    python Scripts/benchmarks/bench_fuzzy.py [--db public/db] [--scales 1 11] [--queries 500] [--brute-queries 50]
+
+Sorgular rastgele kayıtlardan üretilir: isimlerde bir yazım hatası (silme / ekleme / değiştirme / yer değiştirme),
+kodlarda 0x'siz, bir hanesi düşmüş veya signed onluk biçim. Ölçek > 1'de her kopyanın isminde bir kelime
+sözlükten rastgele bir kelimeyle değiştirilir ve rastgele bir 32 bit kod verilir (farklı isim ve kodlarla ~N x kayıt).
+Kaba kuvvet aynı normalizasyon ve mesafe sınırıyla tam matris DP kullanır; sonuç kümeleri karşılaştırılır.
+"""
+import os
+import time
+import random
+import argparse
+import tempfile
+
+from common import load_records
+from modules.config import SHARD_DIR
+from modules.fuzzy_index import (write_fuzzy_index, load_fuzzy_index, normalize_name, code_terms, query_code_terms,
+                                 budget, CODE_MAX_DISTANCE, NAME_MAX_DISTANCE)
+
+def levenshtein(a, b):
+    """Tam matris Levenshtein + bitişik yer değiştirme (OSA), sınırsız."""
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]: cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+def brute_codes(records, token):
+    best = {}
+    for term in query_code_terms(token):
+        md = budget(term, CODE_MAX_DISTANCE)
+        for rid, obj in enumerate(records):
+            for form in code_terms(obj):
+                if abs(len(form) - len(term)) > md: continue
+                d = levenshtein(term, form)
+                if d <= md and d < best.get(rid, d + 1): best[rid] = d
+    return sorted(best.items(), key=lambda hit: (hit[1], hit[0]))
+
+def brute_names(names, text):
+    query = normalize_name(text)
+    md = budget(query, NAME_MAX_DISTANCE)
+    hits = []
+    for rid, name in enumerate(names):
+        if abs(len(name) - len(query)) > md: continue
+        d = levenshtein(query, name)
+        if d <= md: hits.append((rid, d))
+    return sorted(hits, key=lambda hit: (hit[1], hit[0]))
+
+def scaled(records, scale, rng):
+    if scale == 1: return records
+    vocab = sorted({w for obj in records for w in normalize_name(obj.get("name")).split() if len(w) > 2})
+    out = list(records)
+    for _ in range(scale - 1):
+        for obj in records:
+            words = (obj.get("name") or "X").split("_")
+            words[rng.randrange(len(words))] = rng.choice(vocab).upper()
+            value = rng.getrandbits(32)
+            out.append({**obj, "code": f"0x{value:08x}", "codeInt": value - (1 << 32) if value & 0x80000000 else value, "name": "_".join(words)})
+    return out
+
+def typo(text, rng):
+    i = rng.randrange(len(text))
+    kind = rng.choice("dist")
+    if kind == "d" and len(text) > 1: return text[:i] + text[i + 1:]
+    if kind == "i": return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i:]
+    if kind == "t" and i + 1 < len(text): return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1:]
+
+def code_query(obj, rng):
+    code = str(obj.get("code"))
+    code_int = obj.get("codeInt") or 0
+    kind = rng.choice(["bare", "drop", "signed", "typo"]) if code.lower().startswith("0x") else "typo"
+    if kind == "bare": return code[2:]
+    if kind == "signed" and code_int < 0: return str(code_int)
+    if kind == "drop":
+        digits = code[2:].lstrip("0") or "0"
+        i = rng.randrange(len(digits))
+        return "0x" + (digits[:i] + digits[i + 1:] or "0")
+    return typo(code, rng)
+
+def make_queries(records, count, rng):
+    picks = [rng.randrange(len(records)) for _ in range(count)]
+    return [("name", typo(records[rid].get("name") or "x", rng), rid) if n % 2 else ("code", code_query(records[rid], rng), rid) for n, rid in enumerate(picks)]
+
+def percentile(values, p):
+    return sorted(values)[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=SHARD_DIR)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 11])
+    parser.add_argument("--queries", type=int, default=500, help="Queries timed against the index")
+    parser.add_argument("--brute-queries", type=int, default=50, help="How many of them are also run by brute force")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    base = load_records(args.db)
+    out_dir = tempfile.mkdtemp(prefix="bench-fuzzy-")
+    print(f"{'records':>9}{'build s':>9}{'MB':>7}{'load s':>8}{'p50 ms':>8}{'p99 ms':>8}{'brute ms':>10}{'speedup':>9}{'found':>8}{'mismatch':>10}")
+    for scale in args.scales:
+        rng = random.Random(args.seed)
+        records = scaled(base, scale, rng)
+        start = time.perf_counter()
+        path = write_fuzzy_index(records, os.path.join(out_dir, "fuzzy-index.json"))
+        build_s = time.perf_counter() - start
+        start = time.perf_counter()
+        index = load_fuzzy_index(path)
+        load_s = time.perf_counter() - start
+
+        queries = make_queries(records, args.queries, rng)
+        match = {"code": index.match_code, "name": index.match_name}
+        times, results = [], []
+        for kind, text, _ in queries:
+            start = time.perf_counter()
+            results.append(match[kind](text))
+            times.append((time.perf_counter() - start) * 1000)
+        # Hedef kayıt (typo'nun üretildiği kayıt) sonuçlarda mı; kelime sınırını bozan typo'larda bulunmayabilir.
+        found = sum(1 for (_, _, rid), hits in zip(queries, results) if any(r == rid for r, _ in hits))
+
+        names = [normalize_name(obj.get("name")) for obj in records]
+        brute_times, mismatches = [], 0
+        for (kind, text, _), hits in list(zip(queries, results))[:args.brute_queries]:
+            start = time.perf_counter()
+            expected = brute_codes(records, text) if kind == "code" else brute_names(names, text)
+            brute_times.append((time.perf_counter() - start) * 1000)
+            if expected != hits:
+                mismatches += 1
+                if mismatches <= 3: print(f"    [!] {kind} {text!r}: index {hits[:5]} != brute {expected[:5]}")
+
+        p50, brute = percentile(times, 50), percentile(brute_times, 50) if brute_times else 0.0
+        print(f"{len(records):>9,}{build_s:>9.2f}{os.path.getsize(path) / 1e6:>7.1f}{load_s:>8.2f}{p50:>8.3f}{percentile(times, 99):>8.3f}"
+              f"{brute:>10.1f}{brute / p50 if p50 else 0:>8.0f}x{found / len(queries):>8.1%}{f'{mismatches}/{len(brute_times)}':>10}")
+    os.remove(path); os.rmdir(out_dir)
+
+if __name__ == "__main__":
+    main()
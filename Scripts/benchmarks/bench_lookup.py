@@ -0,0 +1,51 @@
+"""
+Toplu kod sorgulama (modules/query.CodeIndex) verimi: 1k / 100k / 1M kod.
+
+    python Scripts/benchmarks/bench_lookup.py [--sizes 1000 100000 1000000]
+
+Girdi, veritabanındaki kodlardan loglarda görülen biçimlerde üretilir
+(dolgulu/dolgusuz hex, 0x'siz, signed onluk, büyük harf) ve ~%10 bilinmeyen kod içerir.
+"""
+import time
+import random
+import argparse
+
+from common import load_records
+from modules.query import CodeIndex, normalize_code
+
+def variants(obj):
+    code = str(obj["code"])
+    out = [code, code.upper()]
+    value = obj.get("codeInt") or 0
+    if code.lower().startswith("0x"):
+        unsigned = int(code, 16)
+        out += ["0x" + format(unsigned, '08X'), format(unsigned, '08x')]
+        if value < 0: out.append(str(value))
+    return out
+
+def make_tokens(records, n, seed=1):
+    rng = random.Random(seed)
+    pool = [v for obj in records for v in variants(obj)]
+    misses = [f"0x{rng.getrandbits(32) | 0x90000000:08x}" for _ in range(1000)]
+    return [rng.choice(misses) if rng.random() < 0.1 else rng.choice(pool) for _ in range(n)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+
+    records = load_records()
+    start = time.perf_counter()
+    index = CodeIndex(records)
+    print(f"[*] {len(records)} records, {len(index.index)} keys, index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{'codes':>10}{'resolved':>10}{'seconds':>10}{'lookups/s':>14}")
+    for n in args.sizes:
+        tokens = make_tokens(records, n)
+        normalize_code.cache_clear()
+        start = time.perf_counter()
+        resolved = sum(1 for _, hits in index.lookup_many(tokens) if hits)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10,}{resolved:>10,}{elapsed:>10.3f}{n / elapsed:>14,.0f}")
+
+if __name__ == "__main__":
+    main()
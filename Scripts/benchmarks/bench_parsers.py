@@ -0,0 +1,98 @@
+"""
+Header parser'ları: eski satır satır parse vs parça parça akan parse (modules/scrapers).
+
+    python Scripts/benchmarks/bench_parsers.py [--cache-dir data/.source-cache] [--scale 10] [--runs 5]
+
+Kayıtlı header kopyaları (<KEY>.body) kullanılır; ağa çıkılmaz. --scale girdiyi N kopya ile büyütür.
+Her kaynak için süre, MB/s ve tracemalloc tepe belleği yazılır; küçük parça boyutuyla da aynı kayıtlar doğrulanır.
+"""
+import os
+import re
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+from collections import deque
+
+from common import median_ms
+from modules.config import CACHE_DIR, STREAM_CHUNK_SIZE
+from modules.fetcher import configure, fetch_text, iter_chunks
+from modules.scrapers import WIN_SOURCES, WIN_PATTERNS, parse_windows_header, parse_linux_header
+from modules.enrichment import to_unsigned_hex
+
+LEGACY_WIN_DEFINE = r'^\s*#define\s+([A-Z0-9_]+)\s+.*?((?:0x[0-9A-Fa-f]+|\-?\d+)L?)'
+LEGACY_LINUX_DEFINE = r'^\s*#define\s+([A-Z0-9]+)\s+(\d+)\s*\/\*\s*(.*?)\s*\*\/'
+
+def legacy_windows(key, source, plat, prefix_filter):
+    errors = []
+    regex = re.compile(LEGACY_WIN_DEFINE)
+    for line in fetch_text(key).splitlines():
+        match = regex.search(line)
+        if match:
+            name = match.group(1); raw_val = match.group(2)
+            if prefix_filter and not re.match(prefix_filter, name): continue
+            if len(name) < 4: continue
+            try:
+                raw_val = raw_val.replace('L', '')
+                int_val = int(raw_val, 16) if '0x' in raw_val else int(raw_val)
+                if int_val > 0x7FFFFFFF: int_val -= 0x100000000
+                errors.append({"code": to_unsigned_hex(int_val).lower(), "codeInt": int_val, "name": name, "description": name.replace('_', ' ').title(), "platform": plat, "source": source, "isCommon": False})
+            except: continue
+    return errors
+
+def legacy_linux(key):
+    errors = []
+    for line in fetch_text(key).splitlines():
+        m = re.search(LEGACY_LINUX_DEFINE, line)
+        if m: errors.append({"code": m.group(2), "codeInt": int(m.group(2)), "name": m.group(1), "description": m.group(3), "platform": "linux", "source": "Linux Kernel", "isCommon": False})
+    return errors
+
+def peak_kb(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+def scaled_copy(cache_dir, keys, scale):
+    """Her gövdenin N kopyasını geçici bir fixture dizinine yazar."""
+    out = tempfile.mkdtemp(prefix="bench-parsers-")
+    for key in keys:
+        with open(os.path.join(cache_dir, key + ".body"), 'rb') as f: body = f.read()
+        if not body.endswith(b"\n"): body += b"\n"
+        with open(os.path.join(out, key + ".body"), 'wb') as f: f.write(body * scale)
+    return out
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Directory with saved <KEY>.body copies")
+    parser.add_argument("--scale", type=int, default=1, help="Concatenate N copies of each header")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [(key, lambda k=key, s=source, p=plat, f=prefix: legacy_windows(k, s, p, f),
+              lambda k=key, s=source, p=plat, chunk=STREAM_CHUNK_SIZE: parse_windows_header(iter_chunks(k, chunk), WIN_PATTERNS[k], s, p))
+             for key, source, plat, prefix in WIN_SOURCES]
+    cases += [(key, lambda k=key: legacy_linux(k), lambda k=key, chunk=STREAM_CHUNK_SIZE: parse_linux_header(iter_chunks(k, chunk)))
+              for key in ["LINUX_BASE", "LINUX_ADV"]]
+
+    cache_dir = args.cache_dir
+    if args.scale > 1: cache_dir = scaled_copy(args.cache_dir, [key for key, _, _ in cases], args.scale)
+    configure(cache_dir=cache_dir, offline=True)
+    try:
+        print(f"{'source':<14}{'MB':>7}{'records':>9}{'legacy ms':>11}{'stream ms':>11}{'legacy MB/s':>13}{'stream MB/s':>13}{'legacy peak KB':>16}{'stream peak KB':>16}  ok")
+        for key, legacy, stream in cases:
+            size = os.path.getsize(os.path.join(cache_dir, key + ".body")) / 1e6
+            expected = legacy()
+            # Küçük parçalar satır sınırı birleştirmesini de sınar.
+            ok = all(list(stream(chunk=chunk)) == expected for chunk in (STREAM_CHUNK_SIZE, 4096, 97))
+            t_old, t_new = median_ms(legacy, args.runs), median_ms(lambda: list(stream()), args.runs)
+            # Eski parser gövdeyi, satır listesini ve kayıt listesini birlikte tutar;
+            # generator tüketilip kayıtlar saklanmadığında tepe bellek tek parça kadardır.
+            m_old, m_new = peak_kb(legacy), peak_kb(lambda: deque(stream(), maxlen=0))
+            print(f"{key:<14}{size:>7.2f}{len(expected):>9}{t_old:>11.1f}{t_new:>11.1f}{size / t_old * 1000:>13.1f}{size / t_new * 1000:>13.1f}{m_old:>16.0f}{m_new:>16.0f}  {'yes' if ok else 'NO'}")
+    finally:
+        if cache_dir != args.cache_dir: shutil.rmtree(cache_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Tüm build hattının (update_db.py) benchmark ve regresyon kontrolü, kaydedilmiş kaynak kopyalarıyla.
+
+    python Scripts/benchmarks/bench_pipeline.py [--scales 1 10 100] [--runs 1]
+    python Scripts/benchmarks/bench_pipeline.py --update-golden   # çıktı bilerek değiştiyse / yeni makinede baz süreler
+    python Scripts/benchmarks/bench_pipeline.py --record          # config.URLS'i yeniden kaydeder (ağ gerekir)
+
+fixtures/<KEY>.body config.URLS'teki her kaynağın kopyasıdır; yerel bir HTTP sunucusu bunları internet yerine sunar.
+Ölçek N'de her kayıt satırı N - 1 kez yeni isim ve kodla çoğaltılır (SCALE_RULES), böylece parse, birleştirme ve
+yazma işleri yaklaşık N kat büyür. Her build ayrı bir süreçte, boş kaynak/build önbelleğiyle (--full) çalışır.
+
+fixtures/golden.json ölçek başına error-db.ts sha256'sını ve faz bazlı baz süreleri tutar. Çıkış kodu 1:
+  - error-db.ts özeti farklıysa (çıktı değişti), ya da fixture'lar golden kaydedildikten sonra değiştiyse
+  - bir faz süresi baz * (1 + --tolerance) + --slack saniyeyi aşıyorsa (--no-timing ile kapatılır)
+"""
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+import subprocess
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import common  # noqa: F401  (Scripts/ yolunu ekler)
+from modules import config
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+GOLDEN_FILE = os.path.join(FIXTURE_DIR, "golden.json")
+MANIFEST_FILE = os.path.join(FIXTURE_DIR, "manifest.json")
+GOLDEN_VERSION = 1
+PHASES = ["fetch", "parse", "static-merge", "custom-merge", "enrich", "serialize", "total"]
+
+# --- Sentetik ölçekleme ---
+# Kaynak -> (kayıt deseni, yeniden yazıcı(m, kopya k, satır i)). Deseni içeren satırlar k = 1..N-1 için yeniden yazılıp eklenir.
+# Yeni kodlar orijinallerle ve birbirleriyle çakışmayacak şekilde kaydırılır.
+_STEP = 0x9E3779B1  # 32 bit hex kodlar için kopya başına kaydırma (altın oran; çakışma olasılığı düşük)
+_HEADER = re.compile(r'^([^\S\n]*#define[^\S\n]+)([A-Z][A-Z0-9_]*)(.*?)(0x[0-9A-Fa-f]+|\d+)(?=L?\b)', re.M)
+_B36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+def _b36(value, width):
+    out = ""
+    for _ in range(width):
+        value, digit = divmod(value, 36)
+        out = _B36[digit] + out
+    return out
+
+def _windows_define(m, k, i):
+    value = m.group(4)
+    value = f"0x{(int(value, 16) + k * _STEP) & 0xFFFFFFFF:08X}" if value.startswith("0x") else str(int(value) + k * 100000)
+    return f"{m.group(1)}{m.group(2)}_S{k}{m.group(3)}{value}"
+
+def _linux_define(m, k, i):
+    return f"{m.group(1)}{m.group(2)}S{k}{m.group(3)}{int(m.group(4)) + k * 1000}"
+
+SCALE_RULES = {
+    "MS_BSOD": (re.compile(r'bug-check-(0x[0-9a-fA-F]+)(-+[a-zA-Z0-9-]+)?'),
+                lambda m, k, i: f"bug-check-0x{(int(m.group(1), 16) + k * _STEP) & 0xFFFFFFFF:08x}{m.group(2) or '-bugcheck'}-s{k}"),
+    "WIN_WIN32": (_HEADER, _windows_define),
+    "WIN_UPDATE": (_HEADER, _windows_define),
+    "WIN_NTSTATUS": (_HEADER, _windows_define),
+    "LINUX_BASE": (_HEADER, _linux_define),
+    "LINUX_ADV": (_HEADER, _linux_define),
+    "HTTP": (re.compile(r'^(\d+),', re.M), lambda m, k, i: f"{int(m.group(1)) + k * 1000},"),
+    "SMTP": (re.compile(r'^(\s*"?[245]\.\d+\.)(\d+)', re.M), lambda m, k, i: f"{m.group(1)}{int(m.group(2)) + k * 1000}"),
+    "POSTGRES": (re.compile(r'^([0-9A-Z]{5})(\s+\S+\s+)(\S+)', re.M), lambda m, k, i: f"{_b36(k, 2)}{_b36(i, 3)}{m.group(2)}{m.group(3)}_S{k}"),
+    "K8S_TYPES": (re.compile(r'(const\s+[A-Z][a-zA-Z0-9]+)(\s*.*=\s*")([^"]+)"'), lambda m, k, i: f'{m.group(1)}S{k}{m.group(2)}{m.group(3)}S{k}"'),
+    "K8S_ERRORS": (re.compile(r'(const\s+StatusReason[A-Z][a-zA-Z0-9]+)(\s*StatusReason\s*=\s*")([^"]+)"'), lambda m, k, i: f'{m.group(1)}S{k}{m.group(2)}{m.group(3)}S{k}"'),
+}
+
+def scaled_body(key, body, scale):
+    rule = SCALE_RULES.get(key)
+    if scale == 1 or rule is None: return body
+    pattern, rewrite = rule
+    text = body.decode('utf-8', errors='replace')
+    lines = [line for line in text.splitlines(keepends=True) if pattern.search(line)]
+    parts = [text if text.endswith("\n") else text + "\n"]
+    for k in range(1, scale):
+        for i, line in enumerate(lines):
+            parts.append(pattern.sub(lambda m: rewrite(m, k, i), line))
+    return "".join(parts).encode('utf-8')
+
+def fixture_paths():
+    return {key: os.path.join(FIXTURE_DIR, f"{key}.body") for key in config.URLS}
+
+def fixtures_digest():
+    h = hashlib.sha256()
+    for key, path in sorted(fixture_paths().items()) + [("custom", os.path.join(FIXTURE_DIR, "custom-knowledge.json"))]:
+        with open(path, 'rb') as f: h.update(key.encode() + b"\0" + hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+# --- Yerel kaynak sunucusu ---
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies = {}
+
+    def do_GET(self):
+        body = self.bodies.get(self.path.lstrip("/"))
+        if body is None:
+            self.send_response(404); self.send_header("Content-Length", "0"); self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve(bodies):
+    handler = type("Fixtures", (FixtureHandler,), {"bodies": bodies})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# --- Tek build (alt süreç) ---
+def child(workdir, port):
+    """config'i geçici dizine ve yerel sunucuya yönlendirip update_db'yi çalıştırır (update_db import'undan önce)."""
+    for key in config.URLS: config.URLS[key] = f"http://127.0.0.1:{port}/{key}"
+    config.OUTPUT_FILE = os.path.join(workdir, "error-db.ts")
+    config.SNAPSHOT_FILE = os.path.join(workdir, "error-db.bin")
+    config.FUZZY_INDEX_FILE = os.path.join(workdir, "fuzzy-index.json")
+    config.SHARD_DIR = os.path.join(workdir, "db")
+    config.BUILD_CACHE_DIR = os.path.join(workdir, ".build-cache")
+    config.CUSTOM_FILE = os.path.join(FIXTURE_DIR, "custom-knowledge.json")
+    config.COLLISION_REPORT = os.path.join(workdir, "collision-report.json")
+    import update_db
+    update_db.main(["--full", "--cache-dir", os.path.join(workdir, ".source-cache"), "--report", os.path.join(workdir, "build-report.json")])
+
+def phase_times(report):
+    phases, sources = report["phases"], report["sources"].values()
+    return {
+        "fetch": phases["download"]["wallSeconds"],
+        "parse": sum(entry.get("parseSeconds", 0) for entry in sources),
+        "static-merge": phases["merge-static"]["wallSeconds"],
+        "custom-merge": phases["merge-custom"]["wallSeconds"],
+        "enrich": phases["enrich"]["wallSeconds"] + sum(entry.get("enrichSeconds", 0) for entry in sources),
+        "serialize": sum(value["wallSeconds"] for name, value in phases.items() if name.startswith("write-")),
+        "total": report["wallSeconds"],
+    }
+
+def run_build(port, verbose=False):
+    workdir = tempfile.mkdtemp(prefix="bench-pipeline-")
+    try:
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--child", workdir, "--port", str(port)], check=True,
+                       stdout=None if verbose else subprocess.DEVNULL)
+        with open(os.path.join(workdir, "build-report.json"), 'r', encoding='utf-8') as f: report = json.load(f)
+        if report["status"] != "ok" or report["totals"]["errors"]:
+            sys.exit(f"[!] build failed or reported source errors: {report.get('error')} {[e for s in report['sources'].values() for e in s['errors']][:3]}")
+        with open(os.path.join(workdir, "error-db.ts"), 'rb') as f: sha = hashlib.sha256(f.read()).hexdigest()
+        return sha, report["totals"]["records"], phase_times(report)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def record():
+    import requests
+    manifest = {}
+    for key, url in config.URLS.items():
+        print(f"[-] {key}: {url}")
+        resp = requests.get(url, timeout=config.TIMEOUTS.get(key, config.DEFAULT_TIMEOUT))
+        resp.raise_for_status()
+        with open(fixture_paths()[key], 'wb') as f: f.write(resp.content)
+        manifest[key] = {"url": url, "bytes": len(resp.content), "sha256": hashlib.sha256(resp.content).hexdigest(), "recordedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+    shutil.copyfile(config.CUSTOM_FILE, os.path.join(FIXTURE_DIR, "custom-knowledge.json"))
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f: json.dump(manifest, f, indent=2)
+    print("[+] Fixtures recorded; run with --update-golden to bless the new outputs.")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--runs", type=int, default=1, help="Builds per scale; the median of each phase is compared (use 3+ for stable timings)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown per phase against golden.json")
+    parser.add_argument("--slack", type=float, default=0.05, help="Allowed absolute slowdown per phase in seconds (noise floor)")
+    parser.add_argument("--no-timing", action="store_true", help="Only check output digests (e.g. on different hardware)")
+    parser.add_argument("--update-golden", action="store_true", help="Write digests and baseline timings to fixtures/golden.json")
+    parser.add_argument("--record", action="store_true", help="Re-record fixtures from config.URLS (needs network)")
+    parser.add_argument("--verbose", action="store_true", help="Show update_db output")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child: return child(args.child, args.port)
+    if args.record: return record()
+
+    missing = [path for path in fixture_paths().values() if not os.path.exists(path)]
+    if missing: sys.exit(f"missing fixtures: {missing}; run with --record")
+    golden = {}
+    if os.path.exists(GOLDEN_FILE):
+        with open(GOLDEN_FILE, 'r', encoding='utf-8') as f: golden = json.load(f)
+    fixtures = fixtures_digest()
+    if golden and not args.update_golden and golden.get("fixtures") != fixtures:
+        sys.exit("[!] fixtures changed since golden.json was written; run with --update-golden")
+
+    raw = {}
+    for key, path in fixture_paths().items():
+        with open(path, 'rb') as f: raw[key] = f.read()
+    failures, results = [], {}
+    print(f"{'scale':>6}{'records':>10}" + "".join(f"{name:>14}" for name in PHASES) + "  digest")
+    for scale in args.scales:
+        server = serve({key: scaled_body(key, body, scale) for key, body in raw.items()})
+        try: runs = [run_build(server.server_address[1], args.verbose) for _ in range(args.runs)]
+        finally: server.shutdown(); server.server_close()
+        shas = {sha for sha, _, _ in runs}
+        if len(shas) > 1: failures.append(f"{scale}x: output differs between runs (non-deterministic build)")
+        sha, records = runs[0][0], runs[0][1]
+        times = {name: sorted(t[name] for _, _, t in runs)[len(runs) // 2] for name in PHASES}
+        results[str(scale)] = {"sha256": sha, "records": records, "phases": {name: round(value, 4) for name, value in times.items()}}
+
+        base = golden.get("scales", {}).get(str(scale))
+        status = "new"
+        if base and not args.update_golden:
+            status = "ok" if base["sha256"] == sha else "CHANGED"
+            if base["sha256"] != sha: failures.append(f"{scale}x: error-db.ts digest {sha[:12]} != golden {base['sha256'][:12]} ({records} vs {base['records']} records)")
+        cells = []
+        for name in PHASES:
+            cell = f"{times[name]:.3f}"
+            if base and not args.update_golden and not args.no_timing:
+                limit = base["phases"][name] * (1 + args.tolerance) + args.slack
+                if times[name] > limit:
+                    failures.append(f"{scale}x: {name} {times[name]:.3f}s > {limit:.3f}s (golden {base['phases'][name]:.3f}s)")
+                    cell += "!"
+            cells.append(f"{cell:>14}")
+        print(f"{scale:>5}x{records:>10,}" + "".join(cells) + f"  {sha[:12]} {status}")
+
+    if args.update_golden:
+        golden = {"version": GOLDEN_VERSION, "fixtures": fixtures, "python": sys.version.split()[0],
+                  "scales": {**golden.get("scales", {}), **results}}
+        with open(GOLDEN_FILE, 'w', encoding='utf-8') as f: json.dump(golden, f, indent=2)
+        print(f"[+] {GOLDEN_FILE} updated")
+    if failures:
+        print("[!] Regressions:")
+        for item in failures: print(f"    {item}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
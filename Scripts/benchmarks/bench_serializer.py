@@ -0,0 +1,89 @@
+"""
+error-db.ts yazımı: eski tek string join vs akan yazıcı (modules/ts_writer.write_ts).
+
+    python Scripts/benchmarks/bench_serializer.py [--scales 1 10 20] [--runs 3]
+
+Veritabanı kayıtları N kez çoğaltılır (kod alanına kopya numarası eklenir). Süre ve tracemalloc tepe belleği yazılır.
+"""
+import os
+import json
+import argparse
+import tempfile
+import tracemalloc
+
+from common import load_records, median_ms
+from modules.ts_writer import write_ts
+
+def legacy_format(obj):
+    desc = obj.get('description', '').replace('"', "'").replace('\\', '\\\\').replace('\n', ' ')
+    hint = json.dumps(obj.get("solutionHint")) if obj.get("solutionHint") else "undefined"
+    doc_url = json.dumps(obj.get("docUrl")) if obj.get("docUrl") else "undefined"
+    severity = json.dumps(obj.get("severity", "Error"))
+    is_common = "true" if obj.get("isCommon") else "false"
+    seen = json.dumps(obj.get("likelySeenIn", []))
+    prods = json.dumps(obj.get("products", []))
+    runbook_str = "undefined"
+    rb = obj.get("runbook")
+    if rb:
+        causes = json.dumps(rb.get("causes", []))
+        cmd = json.dumps(rb.get("fixCommand")) if rb.get("fixCommand") else "undefined"
+        deep = json.dumps(rb.get("deepDive")) if rb.get("deepDive") else "undefined"
+        runbook_str = f"{{ causes: {causes}, fixCommand: {cmd}, deepDive: {deep} }}"
+    return f"""  {{
+    code: "{obj.get('code')}",
+    codeInt: {obj.get('codeInt', 0)},
+    name: "{obj.get('name')}",
+    description: "{desc}",
+    platform: "{obj.get('platform', 'windows')}",
+    source: "{obj.get('source', 'Custom')}",
+    solutionHint: {hint},
+    docUrl: {doc_url},
+    severity: {severity},
+    isCommon: {is_common},
+    runbook: {runbook_str},
+    likelySeenIn: {seen},
+    products: {prods}
+  }}"""
+
+def legacy_write(records, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("import { ErrorCode } from '../src/types';\n\n// AUTO-GENERATED\nexport const errorDatabase: ErrorCode[] = [\n")
+        f.write(",\n".join([legacy_format(obj) for obj in records]))
+        f.write("\n];\n")
+
+def scaled(records, scale):
+    if scale == 1: return records
+    return [{**obj, "code": f"{obj['code']}-{i}"} for i in range(scale) for obj in records]
+
+def peak_mb(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 20])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    base = load_records()
+    out_dir = tempfile.mkdtemp(prefix="bench-serializer-")
+    old_path, new_path = os.path.join(out_dir, "legacy.ts"), os.path.join(out_dir, "stream.ts")
+    print(f"{'records':>10}{'MB':>8}{'legacy ms':>11}{'stream ms':>11}{'speedup':>9}{'legacy peak MB':>16}{'stream peak MB':>16}")
+    try:
+        for scale in args.scales:
+            records = scaled(base, scale)
+            t_old = median_ms(lambda: legacy_write(records, old_path), args.runs)
+            # Her koşuda yeni dosya: değişmeyen içerik kısa yolunu (filecmp) ölçmemek için.
+            t_new = median_ms(lambda: (os.path.exists(new_path) and os.remove(new_path), write_ts(records, new_path)), args.runs)
+            m_old, m_new = peak_mb(lambda: legacy_write(records, old_path)), peak_mb(lambda: write_ts(records, new_path + ".2"))
+            size = os.path.getsize(new_path) / 1e6
+            print(f"{len(records):>10}{size:>8.1f}{t_old:>11.1f}{t_new:>11.1f}{t_old / t_new:>8.2f}x{m_old:>16.1f}{m_new:>16.1f}")
+    finally:
+        for name in os.listdir(out_dir): os.remove(os.path.join(out_dir, name))
+        os.rmdir(out_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+error-db.ts (tek TS literal) ile kompakt shard formatının boyut ve parse süresi karşılaştırması.
+
+    python Scripts/benchmarks/bench_shards.py [--runs 10]
+
+Aynı kayıtlar üzerinden karşılaştırmak için error-db.ts node ile okunur ve geçici dizine shard'lanır.
+Parse süreleri node (tarayıcıdaki V8'e en yakın ölçüm) ve Python için ayrı raporlanır.
+"""
+import os
+import gzip
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from common import OUTPUT_FILE, read_ts_records, median_ms
+from modules.shards import write_shards, load_records
+
+NODE_PARSE_BENCH = r"""
+const fs = require('fs');
+const [tsPath, shardDir, runs] = [process.argv[1], process.argv[2], +process.argv[3]];
+const src = fs.readFileSync(tsPath, 'utf8');
+const body = src.slice(src.indexOf('= [') + 2).replace(/;\s*$/, '');
+const manifestText = fs.readFileSync(shardDir + '/manifest.json', 'utf8');
+const manifest = JSON.parse(manifestText);
+const shardTexts = Object.entries(manifest.shards).map(([p, s]) => [p, fs.readFileSync(shardDir + '/' + s.file, 'utf8')]);
+const time = (fn) => { const t = []; for (let i = 0; i < runs; i++) { const s = process.hrtime.bigint(); fn(); t.push(Number(process.hrtime.bigint() - s) / 1e6); } t.sort((a, b) => a - b); return t[t.length >> 1]; };
+const ts = time(() => new Function('return ' + body)());
+const shards = time(() => {
+  const m = JSON.parse(manifestText); let n = 0;
+  for (const [p, text] of shardTexts) {
+    const rows = JSON.parse(text).rows; const tpl = m.docUrlTemplates[p];
+    for (const r of rows) { n += { id: r[0], code: r[1], source: m.strings[r[5]], docUrl: r[7] === 0 ? tpl.replace('{code}', r[1]) : r[7], products: r[12].map((i) => m.strings[i]) }.id >= 0; }
+  }
+  return n;
+});
+const windowsOnly = time(() => JSON.parse(shardTexts.find(([p]) => p === 'windows')[1]));
+process.stdout.write(JSON.stringify({ ts, shards, windowsOnly }));
+"""
+
+def size_row(label, paths):
+    raw = b"".join(open(p, 'rb').read() for p in paths)
+    return label, len(raw), len(gzip.compress(raw, 6))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ts", default=OUTPUT_FILE)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    records = read_ts_records(args.ts)
+    out_dir = tempfile.mkdtemp(prefix="shards-")
+    try:
+        manifest_path = write_shards(records, out_dir)
+        with open(manifest_path, encoding='utf-8') as f: manifest = json.load(f)
+        shard_paths = [os.path.join(out_dir, s["file"]) for s in manifest["shards"].values()]
+        windows = [os.path.join(out_dir, manifest["shards"]["windows"]["file"])] if "windows" in manifest["shards"] else []
+
+        print(f"[*] {len(records)} records")
+        print(f"{'format':<28}{'bytes':>12}{'gzip':>12}")
+        for label, raw, gz in [size_row("error-db.ts", [args.ts]), size_row("shards (all + manifest)", shard_paths + [manifest_path]), size_row("shards (windows + manifest)", windows + [manifest_path])]:
+            print(f"{label:<28}{raw:>12,}{gz:>12,}")
+
+        node = json.loads(subprocess.run(["node", "-e", NODE_PARSE_BENCH, args.ts, out_dir, str(args.runs)], check=True, capture_output=True, text=True).stdout)
+        py = median_ms(lambda: load_records(out_dir), args.runs)
+        print(f"\n{'parse (median of %d)' % args.runs:<28}{'ms':>12}")
+        print(f"{'node: error-db.ts literal':<28}{node['ts']:>12.2f}")
+        print(f"{'node: shards + decode':<28}{node['shards']:>12.2f}")
+        print(f"{'node: windows shard only':<28}{node['windowsOnly']:>12.2f}")
+        print(f"{'python: load_records()':<28}{py:>12.2f}")
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Soğuk başlangıç: yeni bir Python sürecinde import'tan ilk kod sorgusuna kadar geçen süre.
+
+    python Scripts/benchmarks/bench_startup.py [--snapshot data/error-db.bin] [--db public/db] [--runs 7]
+
+Her durum ayrı bir süreçte çalışır; süreç duvar süresi ve süreç içi (import + yükleme + ilk lookup) süre yazılır.
+"eager requests" satırı requests'in modül yüklemesinde import edildiği eski durumu taklit eder.
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+import common
+from modules.config import SNAPSHOT_FILE, SHARD_DIR
+
+BENCH_DIR = os.path.dirname(os.path.abspath(common.__file__))
+SCRIPTS = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+
+# {setup}: süre ölçümüne dahil edilen import / yükleme kodu; sonunda ilk lookup yapılır.
+CHILD = """
+import time, sys
+t0 = time.perf_counter()
+sys.path.insert(0, {scripts!r})
+{setup}
+print((time.perf_counter() - t0) * 1000)
+"""
+
+def cases(snapshot, db, ts_path):
+    yield "python -c pass", None
+    yield "import update_db (eager requests)", "import requests\nimport update_db"
+    yield "import update_db (lazy)", "import update_db"
+    yield "shards + CodeIndex -> lookup", f"from modules.query import CodeIndex\nCodeIndex.load({db!r}).lookup('0x80070005')"
+    yield "snapshot (mmap) -> lookup", f"from modules.snapshot import SnapshotIndex\nSnapshotIndex({snapshot!r}).lookup('0x80070005')"
+    if ts_path:
+        yield "error-db.ts (node) -> lookup", (f"sys.path.insert(0, {BENCH_DIR!r})\nfrom common import read_ts_records\n"
+                                                f"from modules.query import CodeIndex\nCodeIndex(read_ts_records({ts_path!r})).lookup('0x80070005')")
+
+def run(setup, runs):
+    walls, inner = [], []
+    for _ in range(runs):
+        code = CHILD.format(scripts=SCRIPTS, setup=setup) if setup else "pass"
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, cwd=SCRIPTS).stdout
+        walls.append((time.perf_counter() - start) * 1000)
+        if setup: inner.append(float(out.strip().splitlines()[-1]))
+    med = lambda values: sorted(values)[len(values) // 2] if values else 0.0
+    return med(walls), med(inner)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--snapshot", default=SNAPSHOT_FILE)
+    parser.add_argument("--db", default=SHARD_DIR)
+    parser.add_argument("--ts", default=None, help="Also time parsing error-db.ts through node (e.g. data/error-db.ts)")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    for path in (args.snapshot, os.path.join(args.db, "manifest.json")):
+        if not os.path.exists(path): sys.exit(f"{path} not found; run update_db.py first")
+
+    print(f"{'case':<36}{'process ms':>12}{'in-process ms':>15}")
+    for name, setup in cases(args.snapshot, args.db, args.ts):
+        wall, inner = run(setup, args.runs)
+        print(f"{name:<36}{wall:>12.1f}{inner:>15.1f}")
+
+if __name__ == "__main__":
+    main()
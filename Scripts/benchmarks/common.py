@@ -0,0 +1,36 @@
+"""Benchmark scriptlerinin ortak yardımcıları."""
+import os
+import sys
+import json
+import time
+import shutil
+import subprocess
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from modules.config import OUTPUT_FILE, SHARD_DIR
+
+# error-db.ts -> düz JS ifadesi (import ve tip bildirimi atılır)
+NODE_TS_TO_JSON = r"""
+const fs = require('fs');
+const src = fs.readFileSync(process.argv[1], 'utf8');
+const body = src.slice(src.indexOf('= [') + 2).replace(/;\s*$/, '');
+process.stdout.write(JSON.stringify(new Function('return ' + body)()));
+"""
+
+def read_ts_records(ts_path=OUTPUT_FILE):
+    """error-db.ts içindeki kayıtları node ile okur."""
+    if not shutil.which("node"): sys.exit("node is required to read error-db.ts")
+    out = subprocess.run(["node", "-e", NODE_TS_TO_JSON, ts_path], check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def load_records(db_dir=SHARD_DIR, ts_path=OUTPUT_FILE):
+    """Shard'lar varsa onları, yoksa error-db.ts'i okur."""
+    from modules.shards import load_records as load_shards
+    if os.path.exists(os.path.join(db_dir, "manifest.json")): return load_shards(db_dir)
+    return read_ts_records(ts_path)
+
+def median_ms(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter(); fn(); times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[len(times) // 2]
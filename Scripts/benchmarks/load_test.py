@@ -0,0 +1,147 @@
+"""
+Lookup servisi (Scripts/serve.py) yük testi: p50/p90/p99 gecikme ve saniyedeki istek.
+
+    python Scripts/benchmarks/load_test.py [--url http://127.0.0.1:8787] [--clients 8] [--seconds 10]
+
+--url verilmezse boş bir portta yerel bir serve.py başlatılır ve test sonunda kapatılır.
+Her istemci ayrı bir süreçte tek keep-alive bağlantı üzerinden kapalı döngüde istek atar (istemci tarafı GIL'e takılmaz).
+İstek karışımı --mix ile ayarlanır; --touch-every N her N saniyede veritabanı dosyalarının mtime'ını değiştirip
+test boyunca hot reload tetikler (hata sayısı 0 kalmalıdır).
+"""
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import subprocess
+import http.client
+from urllib.parse import urlsplit, quote
+from concurrent.futures import ProcessPoolExecutor
+
+from common import load_records
+from modules.config import SHARD_DIR
+from modules.service import RELOAD_FILES
+
+SERVE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "serve.py")
+
+def make_workload(records, seed):
+    """(endpoint, method, path, body) üreteci: kod sorguları (dolgulu/signed biçimler, ~%10 bilinmeyen), arama terimleri, batch."""
+    rng = random.Random(seed)
+    codes = [str(obj["code"]) for obj in records]
+    codes += [str(obj["codeInt"]) for obj in records if (obj.get("codeInt") or 0) < 0]
+    words = sorted({w.lower() for obj in records for w in (obj.get("name") or "").split("_") if len(w) >= 3})
+    common = [str(obj["code"]) for obj in records if obj.get("isCommon")] or codes
+
+    def code():
+        r = rng.random()
+        if r < 0.1: return f"0x{rng.getrandbits(32) | 0x90000000:08x}"
+        return rng.choice(common) if r < 0.4 else rng.choice(codes)
+
+    def next_request(kind, batch_size):
+        if kind == "code": return "GET", "/code/" + quote(code(), safe=""), None
+        if kind == "search":
+            r = rng.random()
+            if r < 0.2: return "GET", "/search?common=1", None
+            return "GET", "/search?q=" + quote(rng.choice(words)) + ("&platform=windows" if r > 0.8 else ""), None
+        return "POST", "/batch", json.dumps({"codes": [code() for _ in range(batch_size)]}).encode()
+    return next_request
+
+def client(job):
+    """Tek süreç: deadline'a kadar istek atar, (tür, gecikme ms, durum) listesi döndürür."""
+    url, seconds, mix, batch_size, seed = job
+    db = load_records(url["db"])
+    next_request = make_workload(db, seed)
+    rng = random.Random(seed)
+    kinds, weights = zip(*mix)
+    conn = http.client.HTTPConnection(url["host"], url["port"], timeout=30)
+    results = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        kind = rng.choices(kinds, weights)[0]
+        method, path, body = next_request(kind, batch_size)
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers={"Content-Type": "application/json"} if body else {})
+            resp = conn.getresponse(); resp.read()
+            status = resp.status
+        except (OSError, http.client.HTTPException):
+            status = 0
+            conn.close(); conn = http.client.HTTPConnection(url["host"], url["port"], timeout=30)
+        results.append((kind, (time.perf_counter() - start) * 1000, status))
+    conn.close()
+    return results
+
+def percentile(values, p):
+    if not values: return 0.0
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0)); return s.getsockname()[1]
+
+def wait_ready(host, port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/health"); conn.getresponse().read(); conn.close()
+            return True
+        except OSError: time.sleep(0.1)
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Existing service URL (default: spawn a local serve.py)")
+    parser.add_argument("--db", default=SHARD_DIR, help="Database directory (workload source, and served when spawning)")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent client processes")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--mix", default="code=70,search=25,batch=5", help="Request mix weights")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--cache-size", type=int, help="Passed to the spawned serve.py")
+    parser.add_argument("--touch-every", type=float, default=0, help="Bump database mtimes every N seconds to force hot reloads")
+    args = parser.parse_args()
+
+    mix = [(kind, float(weight)) for kind, weight in (item.split("=") for item in args.mix.split(","))]
+    proc = None
+    if args.url:
+        parts = urlsplit(args.url); host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        cmd = [sys.executable, SERVE, "--host", host, "--port", str(port), "--db", args.db, "--reload-interval", "0.5"]
+        if args.cache_size is not None: cmd += ["--cache-size", str(args.cache_size)]
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    try:
+        if not wait_ready(host, port): sys.exit(f"service at {host}:{port} did not become ready")
+        target = {"host": host, "port": port, "db": args.db}
+        jobs = [(target, args.seconds, mix, args.batch_size, seed) for seed in range(args.clients)]
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.clients) as pool:
+            futures = [pool.submit(client, job) for job in jobs]
+            touches = 0
+            while args.touch_every and not all(f.done() for f in futures):
+                time.sleep(args.touch_every)
+                for name in RELOAD_FILES: os.utime(os.path.join(args.db, name))
+                touches += 1
+            results = [r for f in futures for r in f.result()]
+        elapsed = time.perf_counter() - start
+
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        conn.request("GET", "/health"); health = json.loads(conn.getresponse().read()); conn.close()
+    finally:
+        if proc:
+            proc.terminate(); proc.wait()
+
+    errors = sum(1 for _, _, status in results if status == 0 or status >= 500)
+    print(f"[*] {args.clients} clients x {args.seconds:g}s -> {len(results)} requests, {len(results) / elapsed:,.0f} req/s, {errors} errors")
+    if args.touch_every: print(f"[*] {touches} forced reloads, service generation {health['generation']}, reload errors {health['reloadErrors']}")
+    print(f"[*] cache: {health['cache']}")
+    print(f"{'endpoint':<10}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for kind in [k for k, _ in mix] + ["all"]:
+        lat = sorted(ms for k, ms, _ in results if kind in ("all", k))
+        if not lat: continue
+        print(f"{kind:<10}{len(lat):>10}{len(lat) / elapsed:>10,.0f}{percentile(lat, 50):>10.2f}{percentile(lat, 90):>10.2f}{percentile(lat, 99):>10.2f}{lat[-1]:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import json
+import time
+import argparse
+
+# Modül yolunu ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from modules.config import FUZZY_INDEX_FILE
+from modules.query import open_index
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch error-code lookup over the built database.")
+    parser.add_argument("codes", nargs="*", help="Codes to resolve (0x80070005, 80070005, -2147024891, 404, 42P01 ...)")
+    parser.add_argument("-f", "--file", action="append", default=[], help="Read one code per line from a file ('-' = stdin); repeatable")
+    parser.add_argument("--db", default=None, help="Built database: error-db.bin snapshot or shard directory (default: data/error-db.bin if built, else public/db)")
+    parser.add_argument("--format", choices=["tsv", "json"], default="tsv")
+    parser.add_argument("--misses", action="store_true", help="Also print codes that were not found")
+    parser.add_argument("--fuzzy", action="store_true", help="For codes that are not found, print near matches (typos, dropped digits, misspelled names) from fuzzy-index.json")
+    parser.add_argument("--suggestions", type=int, default=5, help="Max near matches per code with --fuzzy")
+    parser.add_argument("--fuzzy-index", default=FUZZY_INDEX_FILE, help="Fuzzy index written by update_db.py (default: data/fuzzy-index.json)")
+    return parser.parse_args(argv)
+
+def iter_tokens(args):
+    yield from args.codes
+    for path in args.file:
+        f = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8', errors='replace')
+        try:
+            for line in f:
+                token = line.strip()
+                if token: yield token
+        finally:
+            if f is not sys.stdin: f.close()
+    if not args.codes and not args.file and not sys.stdin.isatty():
+        for line in sys.stdin:
+            token = line.strip()
+            if token: yield token
+
+def main(argv=None):
+    args = parse_args(argv)
+    index = open_index(args.db)
+    fuzzy = None
+    if args.fuzzy:
+        from modules.fuzzy_index import load_fuzzy_index
+        if not os.path.exists(args.fuzzy_index): sys.exit(f"{args.fuzzy_index} not found; run update_db.py first")
+        fuzzy = load_fuzzy_index(args.fuzzy_index)
+        # Öneriler kayıt id'siyle döner; indeks başka bir build'e aitse yanlış kayıtlar gösterilir
+        if fuzzy.total != len(index.records): sys.exit(f"{args.fuzzy_index} does not match the database ({fuzzy.total} vs {len(index.records)} records); run update_db.py again")
+    out = sys.stdout
+    total = hits = 0
+    start = time.perf_counter()
+    for token, matches in index.lookup_many(iter_tokens(args)):
+        total += 1
+        suggestions = []
+        if matches: hits += 1
+        elif fuzzy: suggestions = [(index.records[rid], d) for rid, d in fuzzy.lookup(token, limit=args.suggestions)]
+        if not matches and not suggestions and not args.misses: continue
+        if args.format == "json":
+            result = {"query": token, "matches": matches}
+            if fuzzy and not matches: result["suggestions"] = [dict(obj, distance=d) for obj, d in suggestions]
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        elif suggestions:
+            # Öneri satırları: son sütun ~mesafe
+            for obj, d in suggestions:
+                out.write(f"{token}\t{obj['code']}\t{obj['platform']}\t{obj['name']}\t{obj.get('severity', '')}\t{obj.get('description', '')}\t~{d}\n")
+        elif not matches:
+            out.write(f"{token}\t-\t-\t-\t-\t-\n")
+        else:
+            for obj in matches:
+                out.write(f"{token}\t{obj['code']}\t{obj['platform']}\t{obj['name']}\t{obj.get('severity', '')}\t{obj.get('description', '')}\n")
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed else 0
+    print(f"[*] {total} lookups, {hits} resolved in {elapsed:.3f}s ({rate:,.0f}/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+import json
+import hashlib
+from .config import BUILD_CACHE_DIR
+from .fetcher import body_path
+
+# Parse, zenginleştirme ve çıktı formatını belirleyen dosyalar; değişirlerse tüm önbellek geçersiz olur.
+# config.py (REGEX, URL anahtarları) ve fetcher.py (iter_chunks parçalaması) da parse sonucunu belirler.
+CACHE_VERSION = 2
+CODE_FILES = ["config.py", "fetcher.py", "scrapers.py", "enrichment.py", "rules.py", "record_store.py", "shards.py", "search_index.py", "fuzzy_index.py", "ts_writer.py", "snapshot.py", "query.py", os.path.join("..", "update_db.py"), os.path.join("..", "..", "data", "enrichment-rules.json")]
+
+def digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str): part = part.encode('utf-8')
+        h.update(str(len(part)).encode() + b":" + part)
+    return h.hexdigest()
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """digest(dosya içeriği) ile aynı sonuç; dosya parça parça okunur."""
+    if not os.path.exists(path): return digest(b"")
+    h = hashlib.sha256(str(os.path.getsize(path)).encode() + b":")
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b""): h.update(block)
+    return h.hexdigest()
+
+def records_digest(records, fields):
+    """Kayıtların (sırasıyla) verilen alanlarının hash'i; bir çıktı sadece bu alanlardan türüyorsa anahtarıdır."""
+    h = hashlib.sha256()
+    for obj in records: h.update(json.dumps([obj.get(field) for field in fields], ensure_ascii=False).encode('utf-8') + b"\n")
+    return h.hexdigest()
+
+def code_fingerprint():
+    here = os.path.dirname(os.path.abspath(__file__))
+    return digest(str(CACHE_VERSION), *[file_digest(os.path.join(here, name)) for name in CODE_FILES])
+
+class BuildCache:
+    """
+    Artımlı build önbelleği.
+    manifest.json -> {"code", "sources": {ad: hash}, "inputs", "outputs": {yol: hash}, "derived": {ad: hash}}
+    <ad>.json     -> kaynağın parse edilip zenginleştirilmiş kayıt listesi
+    """
+    def __init__(self, cache_dir=BUILD_CACHE_DIR, enabled=True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.code = code_fingerprint()
+        self.manifest = {"code": self.code, "sources": {}}
+        path = os.path.join(cache_dir, "manifest.json")
+        if enabled and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f: manifest = json.load(f)
+            if manifest.get("code") == self.code: self.manifest = manifest
+
+    def source_digest(self, keys):
+        """Kaynağın URL gövdelerinin hash'i; indirme başarısızsa None (önbelleğe alınmaz)."""
+        try: return digest(self.code, *[file_digest(body_path(key)) for key in keys])
+        except Exception: return None
+
+    def load(self, name, source_hash):
+        if not self.enabled or source_hash is None: return None
+        if self.manifest["sources"].get(name) != source_hash: return None
+        path = os.path.join(self.cache_dir, f"{name}.json")
+        if not os.path.exists(path): return None
+        with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+
+    def store(self, name, source_hash, records):
+        if not self.enabled or source_hash is None: return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, f"{name}.json")
+        with open(path + ".tmp", 'w', encoding='utf-8') as f: json.dump(records, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+        self.manifest["sources"][name] = source_hash
+
+    def is_up_to_date(self, inputs_hash, output_paths):
+        """Girdiler aynı ve çıktı dosyaları elle değiştirilmemişse True."""
+        if not self.enabled or self.manifest.get("inputs") != inputs_hash: return False
+        outputs = self.manifest.get("outputs", {})
+        return all(os.path.exists(path) and file_digest(path) == outputs.get(path) for path in output_paths)
+
+    def is_current(self, name, content_hash, path):
+        """Türetilmiş çıktı (indeksler) aynı içerik hash'iyle yazılmış ve sonra değişmemişse True; yeniden yazılmaz."""
+        if not self.enabled or self.manifest.get("derived", {}).get(name) != content_hash: return False
+        return os.path.exists(path) and file_digest(path) == self.manifest.get("outputs", {}).get(path)
+
+    def mark(self, name, content_hash):
+        self.manifest.setdefault("derived", {})[name] = content_hash
+
+    def save(self, inputs_hash, output_paths):
+        if not self.enabled: return
+        self.manifest["inputs"] = inputs_hash
+        self.manifest["outputs"] = {path: file_digest(path) for path in output_paths}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, "manifest.json")
+        with open(path + ".tmp", 'w', encoding='utf-8') as f: json.dump(self.manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Scraper'lar hata ve atılan satırları buraya bildirir; update_db hangi kaynağın çalıştığını source() ile belirler.
+_current = {"report": None, "source": None}
+
+def note_error(key, exc):
+    """Scraper'ın yuttuğu hatayı etkin kaynağın kaydına yazar (rapor yoksa stderr'e)."""
+    report = _current["report"]
+    if report is None or _current["source"] is None:
+        print(f"        [!] {key}: {exc.__class__.__name__}: {exc}", file=sys.stderr)
+        return
+    report.sources[_current["source"]]["errors"].append({"key": key, "type": exc.__class__.__name__, "message": str(exc)})
+
+def note_dropped(count=1):
+    """Parse edilemeyip atlanan satır/eşleşme sayısı."""
+    report = _current["report"]
+    if report is not None and _current["source"] is not None:
+        report.sources[_current["source"]]["dropped"] += count
+
+class _Timer:
+    def __init__(self, trace_memory):
+        self.trace_memory = trace_memory
+        self.wall, self.cpu = time.perf_counter(), time.process_time()
+        if trace_memory: tracemalloc.reset_peak()
+
+    def result(self):
+        out = {"wallSeconds": round(time.perf_counter() - self.wall, 4), "cpuSeconds": round(time.process_time() - self.cpu, 4)}
+        if self.trace_memory: out["peakBytes"] = tracemalloc.get_traced_memory()[1]
+        return out
+
+class BuildReport:
+    """
+    update_db çalışmasının makine tarafından okunabilir raporu.
+    status  -> ok, degraded (çıktılar yazıldı ama kaynak hataları var) ya da failed (istisna veya
+               indirilemeyen ve önbellekte olmayan kaynak; çıktılara dokunulmadı)
+    phases  -> faz başına duvar / CPU süresi (tracemalloc açıksa tepe bellek)
+    sources -> kaynak başına süre, önbellekten mi geldiği, parse / atılan / üzerine yazılan kayıt sayıları, hatalar
+    fetch   -> URL anahtarı başına HTTP durumu, ilk yanıt gecikmesi, toplam süre ve indirilen bayt
+    """
+    def __init__(self, args=None, trace_memory=False):
+        self.trace_memory = trace_memory
+        if trace_memory: tracemalloc.start()
+        self.started = _Timer(False)
+        self.data = {
+            "version": 1,
+            "startedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "args": vars(args) if args is not None else {},
+            "status": "running",
+        }
+        self.phases, self.sources, self.fetch, self.outputs, self.counts = {}, {}, {}, {}, {}
+        _current["report"] = self
+
+    @contextmanager
+    def phase(self, name):
+        timer = _Timer(self.trace_memory)
+        try: yield
+        finally: self.phases[name] = {**self.phases.get(name, {}), **timer.result()}
+
+    @contextmanager
+    def source(self, name, keys):
+        entry = self.sources[name] = {"keys": list(keys), "cached": False, "parsed": 0, "dropped": 0, "errors": []}
+        # Tepe bellek sadece fazlarda ölçülür; kaynaklar bir fazın içinde çalışır.
+        timer = _Timer(False)
+        _current["source"] = name
+        try: yield entry
+        finally:
+            _current["source"] = None
+            entry.update(timer.result())
+
+    @contextmanager
+    def timed(self, entry, field):
+        """entry[field] += geçen süre (ör. kaynak başına zenginleştirme süresi)."""
+        start = time.perf_counter()
+        try: yield
+        finally: entry[field] = round(entry.get(field, 0) + time.perf_counter() - start, 4)
+
+    def add_overwrites(self, overwrites):
+        """RecordStore.overwrites -> kaynak başına overwrote (başkasını ezdi) / overwritten (ezildi) sayıları."""
+        for entry in self.sources.values(): entry.update({"overwrote": 0, "overwritten": 0})
+        for item in overwrites:
+            for side, field in (("kept", "overwrote"), ("replaced", "overwritten")):
+                entry = self.sources.get(item[side]["via"])
+                if entry is not None: entry[field] += 1
+
+    def add_outputs(self, paths):
+        for path in paths:
+            if os.path.exists(path): self.outputs[path] = os.path.getsize(path)
+
+    def finish(self, fetch_stats, error=None):
+        total = self.started.result()
+        if self.trace_memory: total["peakBytes"] = max([phase.get("peakBytes", 0) for phase in self.phases.values()] + [tracemalloc.get_traced_memory()[1]])
+        self.fetch = dict(fetch_stats)
+        errors = sum(len(entry["errors"]) for entry in self.sources.values())
+        self.data.update({
+            # degraded: çıktılar yazıldı ama bir kaynak kısmen parse edilemedi (ör. önbellekteki eski kopya bozuk)
+            "status": "failed" if error else "degraded" if errors else "ok",
+            "error": f"{error.__class__.__name__}: {error}" if error else None,
+            **total,
+            "phases": self.phases,
+            "sources": self.sources,
+            "fetch": self.fetch,
+            "totals": {
+                **self.counts,
+                "bytesFetched": sum(item.get("bytes", 0) for item in self.fetch.values()),
+                "errors": errors,
+            },
+            "outputs": self.outputs,
+        })
+        if self.trace_memory:
+            self.data["topAllocations"] = [f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} {stat.size}" for stat in tracemalloc.take_snapshot().statistics("lineno")[:10]]
+            tracemalloc.stop()
+        _current.update(report=None, source=None)
+        return self.data
+
+    def write(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f: json.dump(self.data, f, indent=2, ensure_ascii=False)
+
+    def summary(self):
+        """Konsol için en yavaş kaynaklar ve hatalar."""
+        lines = [f"    -> Build: {self.data['wallSeconds']:.2f}s wall, {self.data['cpuSeconds']:.2f}s CPU, {self.data['totals']['bytesFetched'] / 1e6:.1f} MB fetched"]
+        for name, entry in sorted(self.sources.items(), key=lambda item: -item[1].get("wallSeconds", 0)):
+            lines.append(f"       {name:<12}{entry.get('wallSeconds', 0):>8.3f}s {entry['parsed']:>7} parsed {entry['dropped']:>5} dropped {entry.get('overwritten', 0):>5} overwritten" + (" (cached)" if entry["cached"] else "") + (f" [!] {len(entry['errors'])} errors" if entry["errors"] else ""))
+        return "\n".join(lines)
@@ -3,7 +3,16 @@ import os
 # --- PATHS ---
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'data'))
 OUTPUT_FILE = os.path.join(BASE_DIR, 'error-db.ts')
+SNAPSHOT_FILE = os.path.join(BASE_DIR, 'error-db.bin')  # Python tüketicileri için mmap'lenebilir ikili kopya (modules/snapshot.py)
+FUZZY_INDEX_FILE = os.path.join(BASE_DIR, 'fuzzy-index.json')  # lookup.py --fuzzy için yazım hatası toleranslı indeks (sadece Python)
 CUSTOM_FILE = os.path.join(BASE_DIR, 'custom-knowledge.json')
+COLLISION_REPORT = os.path.join(BASE_DIR, 'collision-report.json')  # (platform, kod) çakışmaları
+BUILD_REPORT = os.path.join(BASE_DIR, 'build-report.json')  # Faz/kaynak süreleri, indirilen bayt, kayıt sayıları
+RULES_FILE = os.path.join(BASE_DIR, 'enrichment-rules.json')  # products/severity kural tablosu
+CACHE_DIR = os.path.join(BASE_DIR, '.source-cache')  # Koşullu GET önbelleği (body + ETag/Last-Modified)
+BUILD_CACHE_DIR = os.path.join(BASE_DIR, '.build-cache')  # Artımlı build: kaynak hash'leri + zenginleştirilmiş kayıtlar
+PUBLIC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'public'))
+SHARD_DIR = os.path.join(PUBLIC_DIR, 'db')  # Platform bazlı kompakt JSON shard'ları + manifest.json
 
 # --- SOURCE URLS ---
 URLS = {
@@ -24,10 +33,22 @@ URLS = {
     "NODEJS": "https://nodejs.org/dist/latest-v20.x/docs/api/all.json"
 }
 
+# --- FETCH SETTINGS ---
+FETCH_WORKERS = 8          # Aynı anda açık indirme sayısı (--workers ile değiştirilebilir)
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) saniye
+TIMEOUTS = {
+    "MS_BSOD": (5, 60),
+    "WIN_WIN32": (5, 60),
+    "WIN_NTSTATUS": (5, 60),
+}
+STREAM_CHUNK_SIZE = 256 * 1024  # İndirme ve parse sırasında bellekte tutulan en büyük parça
+
 # --- REGEX PATTERNS ---
 REGEX = {
     "BSOD_LINK": r'bug-check-(0x[0-9a-fA-F]+)(?:-+([a-zA-Z0-9-]+))?',
-    "WIN_DEFINE": r'^\s*#define\s+([A-Z0-9_]+)\s+.*?((?:0x[0-9A-Fa-f]+|\-?\d+)L?)',
-    "LINUX_DEFINE": r'^\s*#define\s+([A-Z0-9]+)\s+(\d+)\s*\/\*\s*(.*?)\s*\*\/'
+    # Satır satır değil parça üzerinde (?m) ile çalışırlar: [^\S\n] satır sonunu aşmayan boşluktur.
+    # {prefix}: isim ön eki filtresi desene gömülür (filtre yoksa tek bir isim karakteri).
+    "WIN_DEFINE": r'(?m)^[^\S\n]*#define[^\S\n]+({prefix}[A-Z0-9_]*)[^\S\n]+.*?((?:0x[0-9A-Fa-f]+|\-?\d+)L?)',
+    "LINUX_DEFINE": r'(?m)^[^\S\n]*#define[^\S\n]+([A-Z0-9]+)[^\S\n]+(\d+)[^\S\n]*\/\*[^\S\n]*(.*?)[^\S\n]*\*\/'
     # K8s ve Node.js için özel parser yazacağımız için buraya regex eklemiyoruz.
 }
\ No newline at end of file
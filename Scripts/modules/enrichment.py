@@ -1,4 +1,4 @@
-import json
+from .rules import get_engine
 
 def to_unsigned_hex(int_val, force_pad=False):
     """Sayıyı Hex stringe çevirir (Negatifleri düzeltir)."""
@@ -28,64 +28,20 @@ def generate_doc_url(code, platform, name):
     return None
 
 def determine_severity(code, name, platform):
-    """Hata ismine ve koduna göre kritiklik seviyesi belirler."""
-    name_u = name.upper()
-    if "SUCCESS" in name_u or "OK" in name_u or "INFO" in name_u: return "Info"
-    if "WARNING" in name_u or "PENDING" in name_u: return "Warning"
-    if "FATAL" in name_u or "CRITICAL" in name_u or "PANIC" in name_u or platform == "bsod": return "Critical"
-    return "Error"
+    """Hata ismine ve koduna göre kritiklik seviyesi belirler (kurallar: data/enrichment-rules.json)."""
+    return get_engine().evaluate(code, name, platform)[0]
 
 def determine_products(code_hex, name, existing_tags, platform):
-    products = set()
-    safe_name = name if name else ""
-    code_clean = code_hex.lower().replace('0x', '')
-    
-    if platform == "linux": products.add("Linux Kernel"); return list(products)
-    if platform == "web": products.add("Web/API"); return list(products)
-    if platform == "smtp": products.add("Exchange/Postfix"); return list(products)
-    if platform == "database": products.add("PostgreSQL/SQL"); return list(products)
-    if platform == "container": products.add("Docker/K8s"); return list(products)
-    if platform == "bsod": products.add("BSOD/Crash"); products.add("Kernel"); return list(products)
-
-    if safe_name.startswith("STATUS_") or safe_name.startswith("BUGCODE_"): products.add("Kernel/Driver")
-    if code_clean.startswith("800f") or code_clean.startswith("8024") or "cbs" in safe_name.lower() or "wu_" in safe_name.lower():
-        products.add("Windows Update"); products.add("DISM/CBS")
-    if safe_name.startswith("WSA") or (code_clean.startswith("27") and len(code_clean) == 4):
-        products.add("Winsock/TCP"); products.add("Network")
-
-    if not products: products.add("System")
-    return list(products)
-
-def format_ts_object(obj):
-    desc = obj.get('description', '').replace('"', "'").replace('\\', '\\\\').replace('\n', ' ')
-    hint = json.dumps(obj.get("solutionHint")) if obj.get("solutionHint") else "undefined"
-    doc_url = json.dumps(obj.get("docUrl")) if obj.get("docUrl") else "undefined"
-    severity = json.dumps(obj.get("severity", "Error"))
-    is_common = "true" if obj.get("isCommon") else "false"
-    
-    seen = json.dumps(obj.get("likelySeenIn", []))
-    prods = json.dumps(obj.get("products", []))
-
-    runbook_str = "undefined"
-    if "runbook" in obj:
-        rb = obj["runbook"]
-        causes = json.dumps(rb.get("causes", []))
-        cmd = json.dumps(rb.get("fixCommand")) if rb.get("fixCommand") else "undefined"
-        deep = json.dumps(rb.get("deepDive")) if rb.get("deepDive") else "undefined"
-        runbook_str = f"{{ causes: {causes}, fixCommand: {cmd}, deepDive: {deep} }}"
-
-    return f"""  {{
-    code: "{obj.get('code')}",
-    codeInt: {obj.get('codeInt', 0)},
-    name: "{obj.get('name')}",
-    description: "{desc}",
-    platform: "{obj.get('platform', 'windows')}",
-    source: "{obj.get('source', 'Custom')}",
-    solutionHint: {hint},
-    docUrl: {doc_url},
-    severity: {severity},
-    isCommon: {is_common},
-    runbook: {runbook_str},
-    likelySeenIn: {seen},
-    products: {prods}
-  }}"""
\ No newline at end of file
+    return list(get_engine().evaluate(code_hex, name, platform)[1])
+
+def enrich_records(records):
+    """products / docUrl / severity alanlarını kayıtlara tek toplu geçişte yazar."""
+    results = get_engine().evaluate_batch([(obj.get("code"), obj.get("name"), obj.get("platform", "windows")) for obj in records])
+    for obj, (severity, products) in zip(records, results):
+        obj["products"] = list(products)
+        obj["docUrl"] = generate_doc_url(obj.get("code"), obj.get("platform"), obj.get("name"))
+        obj["severity"] = severity
+    return records
+
+def enrich_record(obj):
+    return enrich_records([obj])[0]
@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from .config import URLS, CACHE_DIR, FETCH_WORKERS, DEFAULT_TIMEOUT, TIMEOUTS, STREAM_CHUNK_SIZE
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+
+# configure() ile değişir: offline modda ağa hiç çıkılmaz, her şey önbellekten okunur.
+# workers: paralel indirme sayısı; host başına bağlantı havuzu da bu boyuttadır.
+SETTINGS = {"cache_dir": CACHE_DIR, "offline": False, "workers": FETCH_WORKERS}
+
+_sessions = {}
+_bodies = {}
+# URL anahtarı -> {"status", "httpStatus", "latencyMs", "seconds", "bytes"[, "error"]} (build raporu için)
+STATS = {}
+_lock = threading.Lock()
+
+def configure(cache_dir=None, offline=False, workers=None):
+    if cache_dir: SETTINGS["cache_dir"] = os.path.abspath(cache_dir)
+    SETTINGS["offline"] = offline
+    if workers: _set_workers(workers)
+    _bodies.clear()
+    STATS.clear()
+
+def _set_workers(workers):
+    """Havuz boyutu değişirse açık Session'lar kapatılır; yenileri yeni boyutla açılır."""
+    with _lock:
+        if workers == SETTINGS["workers"]: return
+        SETTINGS["workers"] = workers
+        for session in _sessions.values(): session.close()
+        _sessions.clear()
+
+def get_session(url):
+    """Her host için tek bir bağlantı havuzlu Session döndürür."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    host = urlsplit(url).netloc
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, SETTINGS["workers"]))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[host] = session
+    return session
+
+# --- ON-DISK CACHE ---
+# <cache_dir>/<KEY>.body : ham yanıt gövdesi
+# <cache_dir>/<KEY>.json : {"url", "etag", "lastModified", "fetchedAt"}
+# Fixture dizini olarak kullanmak için sadece .body dosyaları yeterlidir (--offline).
+
+def _cache_paths(key):
+    base = os.path.join(SETTINGS["cache_dir"], key)
+    return base + ".body", base + ".json"
+
+def read_meta(key):
+    _, meta_path = _cache_paths(key)
+    if not os.path.exists(meta_path): return {}
+    with open(meta_path, 'r', encoding='utf-8') as f: return json.load(f)
+
+def _stream_to_cache(key, response, meta):
+    """Yanıt gövdesini parça parça önbelleğe yazar; gövde hiçbir zaman tümüyle bellekte tutulmaz."""
+    body_path, meta_path = _cache_paths(key)
+    os.makedirs(os.path.dirname(body_path), exist_ok=True)
+    tmp = body_path + ".tmp"
+    size = 0
+    try:
+        with open(tmp, 'wb') as f:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                f.write(chunk); size += len(chunk)
+    except BaseException:
+        if os.path.exists(tmp): os.remove(tmp)
+        raise
+    os.replace(tmp, body_path)
+    with open(meta_path + ".tmp", 'w') as f: f.write(json.dumps(meta, indent=2))
+    os.replace(meta_path + ".tmp", meta_path)
+    return body_path, size
+
+def download(key):
+    """Kaynağı önbelleğe indirir ve gövde dosyasının yolunu döndürür."""
+    body_path, _ = _cache_paths(key)
+    cached = body_path if os.path.exists(body_path) else None
+    if SETTINGS["offline"]:
+        if cached is None: raise FileNotFoundError(f"{key} is not in the source cache ({SETTINGS['cache_dir']})")
+        STATS[key] = {"status": "offline", "bytes": 0}
+        return cached
+    import requests  # offline / önbellek yollarında requests hiç yüklenmez
+    meta = read_meta(key) if cached else {}
+    url = URLS[key]
+    headers = {}
+    if cached is not None and meta.get("url") == url:
+        if meta.get("etag"): headers["If-None-Match"] = meta["etag"]
+        if meta.get("lastModified"): headers["If-Modified-Since"] = meta["lastModified"]
+    start = time.perf_counter()
+    stats = STATS[key] = {"status": "error", "bytes": 0}
+    try:
+        with get_session(url).get(url, headers=headers, timeout=TIMEOUTS.get(key, DEFAULT_TIMEOUT), stream=True) as r:
+            # elapsed: istek gönderiminden yanıt başlıklarının gelmesine kadar geçen süre
+            stats.update(httpStatus=r.status_code, latencyMs=round(r.elapsed.total_seconds() * 1000, 1))
+            if r.status_code == 304 and headers:
+                stats.update(status="not-modified", seconds=round(time.perf_counter() - start, 4))
+                return cached
+            r.raise_for_status()
+            path, size = _stream_to_cache(key, r, {
+                "url": url,
+                "etag": r.headers.get("ETag"),
+                "lastModified": r.headers.get("Last-Modified"),
+                "fetchedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            })
+            stats.update(status="downloaded", bytes=size, seconds=round(time.perf_counter() - start, 4))
+            return path
+    except requests.RequestException as e:
+        stats.update(error=f"{e.__class__.__name__}: {e}", seconds=round(time.perf_counter() - start, 4))
+        if cached is None: raise
+        stats["status"] = "cache-fallback"
+        print(f"        [!] {key}: {e.__class__.__name__}, using cached copy from {meta.get('fetchedAt', 'unknown')}")
+        return cached
+
+def prefetch(keys, workers=None):
+    """Verilen kaynakları paralel indirir; hatalar body_path / fetch_text çağrısında yükseltilir."""
+    if workers: _set_workers(workers)
+    workers = SETTINGS["workers"]
+    def worker(key):
+        try: return download(key)
+        except Exception as e: return e
+    keys = list(dict.fromkeys(keys))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for key, body in zip(keys, pool.map(worker, keys)):
+            _bodies[key] = body
+
+def body_path(key):
+    """Kaynağın önbellekteki gövde dosyası (önceden indirildiyse tekrar indirmez)."""
+    if key not in _bodies:
+        try: _bodies[key] = download(key)
+        except Exception as e: _bodies[key] = e
+    path = _bodies[key]
+    if isinstance(path, Exception): raise path
+    return path
+
+def unavailable(keys):
+    """İndirilemeyen ve önbellekte kopyası da olmayan anahtarlar."""
+    return [key for key in keys if isinstance(_bodies.get(key), Exception)]
+
+def fetch_bytes(key):
+    with open(body_path(key), 'rb') as f: return f.read()
+
+def iter_chunks(key, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Gövdeyi satır sınırına hizalı metin parçaları halinde okur; bellekte en fazla bir parça (+ yarım satır) tutulur.
+    Parçalar "\n" ile biter (son parça hariç), böylece (?m) desenleri parçalar üzerinde satır satır ile aynı sonucu verir.
+    """
+    rest = b""
+    with open(body_path(key), 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            if not cut:
+                rest = block; continue
+            rest = block[cut:]
+            yield block[:cut].decode('utf-8', errors='replace')
+    if rest: yield rest.decode('utf-8', errors='replace')
+
+def fetch_text(key):
+    return fetch_bytes(key).decode('utf-8', errors='replace')
@@ -0,0 +1,227 @@
+import os
+import re
+import json
+from .config import FUZZY_INDEX_FILE
+
+# Yazım hatası toleranslı eşleme indeksi (data/fuzzy-index.json), SymSpell tarzı silme sözlüğü:
+#   codes -> kod biçimleri (0x'siz dolgusuz hex, unsigned onluk, diğer kodlar küçük harf)
+#   words -> isimlerdeki kelimeler (küçük harf, alfanümerik olmayan karakterlerden bölünmüş)
+#   names -> kayıt id'si -> normalize isim (kelimeler tek boşlukla)
+# Her sözlükte terms[tid], postings[tid] (kayıt id'leri) ve deletes: terimden en fazla maxDistance karakter
+# silinerek elde edilen her string -> tid listesi. Sorguda sorgunun silme biçimleri aranır, adaylar
+# optimal string alignment (Levenshtein + bitişik yer değiştirme) mesafesiyle doğrulanır.
+# İsim araması kelime düzeyindedir; kelime sınırını bozan hatalar için bölme/birleştirme ile ikinci bir deneme yapılır.
+INDEX_VERSION = 1
+FUZZY_FIELDS = ("code", "codeInt", "name")  # İndeks sadece bu alanlardan (ve kayıt sırasından) türer
+CODE_MAX_DISTANCE = 1
+NAME_MAX_DISTANCE = 2
+CANDIDATE_LIMIT = 64  # Aday küme bu kadar küçülünce diğer kelimelerle kesişim yapılmaz, doğrudan doğrulanır
+
+_HEX_DIGITS = re.compile(r'^[0-9a-f]+$')
+_DEC = re.compile(r'^-?\d+$')
+_C_SUFFIX = re.compile(r'^(-?(?:0x)?[0-9a-f]+)l$')
+_WORD = re.compile(r'[a-z0-9]+')
+
+def normalize_name(text):
+    return " ".join(_WORD.findall((text or "").lower()))
+
+def _strip_zeros(digits):
+    return (digits.lstrip('0') or '0') if _HEX_DIGITS.match(digits) else digits
+
+def code_terms(obj):
+    """Bir kaydın fuzzy kod sözlüğüne girdiği biçimler."""
+    code = str(obj.get("code", "")).lower()
+    code_int = (obj.get("codeInt") or 0) & 0xFFFFFFFF
+    if code.startswith("0x"): return {_strip_zeros(code[2:]), format(code_int, "x"), str(code_int)} if code_int else {_strip_zeros(code[2:])}
+    return {_strip_zeros(code) if _DEC.match(code) else code}
+
+def query_code_terms(token):
+    """Sorgu metninin kod biçimleri: 0x'li/0x'siz hex, signed/unsigned onluk, C soneki (L)."""
+    t = token.strip().lower()
+    m = _C_SUFFIX.match(t)
+    if m: t = m.group(1)
+    if not t: return ()
+    if _DEC.match(t) and t.startswith("-"):
+        value = int(t) & 0xFFFFFFFF
+        return (format(value, "x"), str(value))
+    if t.startswith("0x"): t = t[2:]  # 0x'ten sonrası hatalı olsa da hex haneleriyle karşılaştırılır
+    elif t.startswith("x") and _HEX_DIGITS.match(t[1:]): t = t[1:]
+    return (_strip_zeros(t),) if t else ()  # onluk ve 0x'siz hex aynı string
+
+def budget(text, limit):
+    """Kısa sorgularda izin verilen mesafe: her 3 karakter için 1, en fazla limit."""
+    return min(limit, len(text) // 3)
+
+def osa_distance(a, b, max_distance):
+    """a ile b arasındaki OSA mesafesi; max_distance'ı aşarsa max_distance + 1 (bantlı DP, erken çıkış)."""
+    if a == b: return 0
+    over = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance: return over
+    # Ortak önek / sonek mesafeyi değiştirmez; DP sadece aradaki farklı kısımda çalışır
+    i, n = 0, min(len(a), len(b))
+    while i < n and a[i] == b[i]: i += 1
+    k = 0
+    while k < n - i and a[-1 - k] == b[-1 - k]: k += 1
+    a, b = a[i:len(a) - k], b[i:len(b) - k]
+    la, lb = len(a), len(b)
+    if not la or not lb: return max(la, lb) if max(la, lb) <= max_distance else over
+    prev2, prev = None, [j if j <= max_distance else over for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        ca = a[i - 1]
+        lo, hi = max(1, i - max_distance), min(lb, i + max_distance)
+        cur = [over] * (lb + 1)
+        if i <= max_distance: cur[0] = i
+        best = cur[0]
+        for j in range(lo, hi + 1):
+            cb = b[j - 1]
+            v = prev[j - 1] + (ca != cb)
+            if prev[j] + 1 < v: v = prev[j] + 1
+            if cur[j - 1] + 1 < v: v = cur[j - 1] + 1
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb and prev2[j - 2] + 1 < v: v = prev2[j - 2] + 1
+            cur[j] = v
+            if v < best: best = v
+        if best > max_distance: return over
+        prev2, prev = prev, cur
+    return prev[lb] if prev[lb] <= max_distance else over
+
+def deletes(term, max_distance):
+    """term'den en fazla max_distance karakter silinerek elde edilen stringler (term dahil)."""
+    out, level = {term}, {term}
+    for _ in range(max_distance):
+        level = {t[:i] + t[i + 1:] for t in level if len(t) > 1 for i in range(len(t))} - out
+        out |= level
+    return out
+
+def _build_dictionary(term_postings, max_distance):
+    terms = sorted(term_postings)
+    table = {}
+    for tid, term in enumerate(terms):
+        for d in deletes(term, max_distance): table.setdefault(d, []).append(tid)
+    return {"maxDistance": max_distance, "terms": terms, "postings": [sorted(term_postings[t]) for t in terms], "deletes": dict(sorted(table.items()))}
+
+def build_fuzzy_index(records):
+    codes, words = {}, {}
+    names = []
+    for rid, obj in enumerate(records):
+        for term in code_terms(obj): codes.setdefault(term, set()).add(rid)
+        name = normalize_name(obj.get("name"))
+        names.append(name)
+        for word in set(name.split()): words.setdefault(word, set()).add(rid)
+    return {
+        "version": INDEX_VERSION,
+        "total": len(records),
+        "codes": _build_dictionary(codes, CODE_MAX_DISTANCE),
+        "words": _build_dictionary(words, NAME_MAX_DISTANCE),
+        "names": names,
+    }
+
+def write_fuzzy_index(records, path=FUZZY_INDEX_FILE):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(build_fuzzy_index(records), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(path + ".tmp", path)
+    return path
+
+def load_fuzzy_index(path=FUZZY_INDEX_FILE):
+    with open(path, 'r', encoding='utf-8') as f: return FuzzyIndex(json.load(f))
+
+class _Dictionary:
+    def __init__(self, data):
+        self.max_distance = data["maxDistance"]
+        self.terms = data["terms"]
+        self.postings = data["postings"]
+        self.deletes = data["deletes"]
+        self.ids = {term: tid for tid, term in enumerate(self.terms)}
+
+    def exact(self, term):
+        tid = self.ids.get(term)
+        return () if tid is None else self.postings[tid]
+
+    def lookup(self, term, max_distance):
+        """(tid, mesafe) çiftleri: terime max_distance içinde olan sözlük terimleri."""
+        seen, get, terms = set(), self.deletes.get, self.terms
+        for variant in deletes(term, min(max_distance, self.max_distance)):
+            for tid in get(variant, ()):
+                if tid in seen: continue
+                seen.add(tid)
+                d = osa_distance(term, terms[tid], max_distance)
+                if d <= max_distance: yield tid, d
+
+class FuzzyIndex:
+    """fuzzy-index.json okuyucusu. Sonuçlar (kayıt id'si, mesafe) çiftleridir; mesafe, sonra id sırasıyla."""
+    def __init__(self, data):
+        self.total = data["total"]
+        self.codes = _Dictionary(data["codes"])
+        self.words = _Dictionary(data["words"])
+        self.names = data["names"]
+
+    def match_code(self, token, max_distance=None):
+        limit = self.codes.max_distance if max_distance is None else min(max_distance, self.codes.max_distance)
+        best = {}
+        for term in query_code_terms(token):
+            for tid, d in self.codes.lookup(term, budget(term, limit)):
+                for rid in self.codes.postings[tid]:
+                    if d < best.get(rid, d + 1): best[rid] = d
+        return sorted(((rid, d) for rid, d in best.items()), key=lambda hit: (hit[1], hit[0]))
+
+    def _candidates(self, words, md):
+        # Kelime sınırları korunuyorsa: toplam mesafe md iken (1) k kelimeden en az k - md tanesi birebir eşleşir,
+        # bu yüzden en seyrek md + 1 kelimenin birebir kayıtları bir aday kümesidir; (2) her kelime kendi
+        # karşılığına en fazla md uzaktadır. Küme CANDIDATE_LIMIT altına inene kadar en seçici kelimelerin
+        # fuzzy eşleşmeleriyle kesişim alınır; son karar tam isim mesafesidir.
+        exact, postings = self.words.exact, self.words.postings
+        candidates = None
+        if len(words) > md: candidates = set().union(*sorted(map(exact, words), key=len)[:md + 1])
+        for word in sorted(set(words), key=lambda w: (len(w) <= md + 1, len(exact(w)), -len(w))):
+            # md + 1 harften kısa kelimelerin fuzzy komşuları sözlüğün büyük kısmıdır; aday varsa doğrulama daha ucuz
+            if candidates is not None and (len(candidates) <= CANDIDATE_LIMIT or len(word) <= md + 1): break
+            ids = {rid for tid, _ in self.words.lookup(word, md) for rid in postings[tid]}
+            candidates = ids if candidates is None else candidates & ids
+        return candidates or ()
+
+    def _resplit(self, words):
+        """
+        Kelime sınırı hataları için ikinci deneme: sözlükte olmayan kelime iki sözlük kelimesine bölünür
+        (ayraç silinmiş ya da harfe dönmüş: localddisconnect -> local disconnect), bitişik iki kelimenin
+        birleşimi sözlükteyse birleştirilir (araya ayraç girmiş: acc ess -> access).
+        """
+        known = self.words.ids
+        out, i = [], 0
+        while i < len(words):
+            word = words[i]
+            if i + 1 < len(words) and word + words[i + 1] in known and (word not in known or words[i + 1] not in known):
+                out.append(word + words[i + 1]); i += 2
+                continue
+            split = None
+            if word not in known:
+                split = next(([word[:j], word[j + skip:]] for skip in (0, 1) for j in range(1, len(word) - skip)
+                              if word[:j] in known and word[j + skip:] in known), None)
+            out += split or [word]; i += 1
+        return out
+
+    def match_name(self, text, max_distance=None):
+        query = normalize_name(text)
+        if not query: return []
+        limit = self.words.max_distance if max_distance is None else min(max_distance, self.words.max_distance)
+        md = budget(query, limit)
+        words = query.split()
+        hits = self._verify(query, self._candidates(words, md), md)
+        if not hits:
+            resplit = self._resplit(words)
+            if resplit != words: hits = self._verify(query, self._candidates(resplit, md), md)
+        return hits
+
+    def _verify(self, query, candidates, md):
+        hits = []
+        for rid in candidates:
+            d = osa_distance(query, self.names[rid], md)
+            if d <= md: hits.append((rid, d))
+        return sorted(hits, key=lambda hit: (hit[1], hit[0]))
+
+    def lookup(self, token, max_distance=None, limit=None):
+        """Kod ve isim eşleşmeleri birlikte; bir kayıt iki yoldan da gelirse küçük mesafe geçerlidir."""
+        best = {}
+        for rid, d in self.match_code(token, max_distance) + self.match_name(token, max_distance):
+            if d < best.get(rid, d + 1): best[rid] = d
+        hits = sorted(best.items(), key=lambda hit: (hit[1], hit[0]))
+        return hits[:limit] if limit else hits
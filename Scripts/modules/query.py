@@ -0,0 +1,88 @@
+import os
+import re
+from functools import lru_cache
+from .config import SHARD_DIR, SNAPSHOT_FILE
+from .enrichment import to_unsigned_hex
+
+# Sorgu tarafı normalizasyonu, build'in ürettiği kod biçimleriyle aynı kuralları izler:
+#   hex (0x'li/0x'siz, dolgulu/dolgusuz) -> "0x" + dolgusuz küçük hex  (to_unsigned_hex)
+#   negatif onluk (signed HRESULT)       -> unsigned hex
+#   onluk                                -> kendisi, ardından hex yorumu (Win32 hataları loglarda onluk geçer)
+#   diğerleri (SQLSTATE, SMTP, K8s)      -> küçük harf
+_HEX = re.compile(r'^(?:0x)?([0-9a-f]{1,8})$')
+_DEC = re.compile(r'^-?\d+$')
+_C_SUFFIX = re.compile(r'^(-?(?:0x)?[0-9a-f]+)l$')  # winerror.h tarzı 0x80070005L
+
+@lru_cache(maxsize=65536)
+def normalize_code(token):
+    """Bir kod metni için aranacak index anahtarları (öncelik sırasıyla)."""
+    t = token.strip().lower()
+    if not t: return ()
+    m = _C_SUFFIX.match(t)
+    # Sonek soyulmadan önce metnin kendisi denenir: SQLSTATE 2200L gibi kodlar L ile biter
+    if m: return tuple(dict.fromkeys((t,) + _code_keys(m.group(1))))
+    return _code_keys(t)
+
+def _code_keys(t):
+    if _DEC.match(t):
+        value = int(t)
+        if not -(1 << 31) <= value <= 0xFFFFFFFF: return (t.lstrip('0') or '0',)  # 32 bit dışı: hex yorumu yok
+        if value < 0: return (to_unsigned_hex(value),)
+        keys = [t.lstrip('0') or '0', to_unsigned_hex(value)]
+        if len(t) == 8: keys.append(to_unsigned_hex(int(t, 16)))  # 80070005 gibi 0x'siz HRESULT
+        return tuple(dict.fromkeys(keys))
+    m = _HEX.match(t)
+    if m and (t.startswith('0x') or len(t) == 8):
+        return (to_unsigned_hex(int(m.group(1), 16)),)
+    return (t,)
+
+def record_keys(obj):
+    """Bir kaydın index'e girdiği anahtarlar."""
+    code = str(obj.get("code", "")).lower()
+    if code.startswith("0x"):
+        try: return (to_unsigned_hex(int(code, 16)),)
+        except ValueError: return (code,)
+    if _DEC.match(code): return (code.lstrip('0') or '0',)
+    return (code,)
+
+class CodeIndex:
+    """Normalize kod -> kayıtlar. Bir kod birden fazla platformda olabilir; hepsi döner."""
+    def __init__(self, records):
+        self.records = records
+        index = {}
+        for rid, obj in enumerate(records):
+            for key in record_keys(obj): index.setdefault(key, []).append(rid)
+        self.index = {key: tuple(ids) for key, ids in index.items()}
+
+    @classmethod
+    def load(cls, db_dir=SHARD_DIR):
+        from .shards import load_records
+        return cls(load_records(db_dir))
+
+    def lookup(self, token):
+        ids = ()
+        for key in normalize_code(token):
+            hit = self.index.get(key)
+            if hit: ids += hit
+        return [self.records[i] for i in dict.fromkeys(ids)]
+
+    def lookup_many(self, tokens):
+        """(token, kayıtlar) çiftleri üretir; büyük girdiler için generator."""
+        get, records = self.index.get, self.records
+        for token in tokens:
+            ids = ()
+            for key in normalize_code(token):
+                hit = get(key)
+                if hit: ids += hit
+            yield token, [records[i] for i in dict.fromkeys(ids)] if ids else []
+
+def open_index(db=None):
+    """
+    Kod index'ini açar. db bir dosyaysa ikili snapshot (error-db.bin), dizinse shard'lar (public/db).
+    Verilmezse build'in yazdığı snapshot, yoksa shard dizini kullanılır.
+    """
+    if db is None: db = SNAPSHOT_FILE if os.path.exists(SNAPSHOT_FILE) else SHARD_DIR
+    if os.path.isfile(db):
+        from .snapshot import SnapshotIndex
+        return SnapshotIndex(db)
+    return CodeIndex.load(db)
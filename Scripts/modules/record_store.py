@@ -0,0 +1,67 @@
+class RecordStore:
+    """
+    (platform, normalize kod) anahtarlı kayıt deposu.
+    Linux errno "2", HTTP "404" ve Windows 0x2 gibi farklı platformlardaki aynı kodlar ayrı kayıtlardır;
+    by_code ikincil index'i çıplak koddan tüm platformlardaki kayıtlara gider.
+    Aynı platform+kod ikinci kez eklenirse kayıt değiştirilir ve collision raporuna yazılır.
+    """
+    def __init__(self):
+        self.records = {}
+        self.by_code = {}
+        self.origin = {}
+        self.overwrites = []
+
+    @staticmethod
+    def normalize(code):
+        """Küçük harf; 0x'li kodlar sayısal değerle birleşir (0x000006be ve 0x6be aynı anahtar). Gösterilen code değişmez."""
+        code = str(code).strip().lower()
+        if code.startswith("0x"):
+            try: return "0x" + format(int(code, 16), "x")
+            except ValueError: pass
+        return code
+
+    def key(self, platform, code):
+        return (platform, self.normalize(code))
+
+    def add(self, obj, source):
+        key = self.key(obj.get("platform", "windows"), obj.get("code"))
+        old = self.records.get(key)
+        if old is not None:
+            self.overwrites.append({
+                "platform": key[0], "code": obj.get("code"),
+                "kept": {"via": source, "source": obj.get("source"), "name": obj.get("name")},
+                "replaced": {"via": self.origin[key], "source": old.get("source"), "name": old.get("name")},
+            })
+        else:
+            self.by_code.setdefault(key[1], []).append(key)
+        self.records[key] = obj
+        self.origin[key] = source
+        return key
+
+    def get(self, platform, code):
+        return self.records.get(self.key(platform, code))
+
+    def find(self, code):
+        """Çıplak koda karşılık gelen tüm platformlardaki kayıtlar (ekleme sırasıyla)."""
+        return [self.records[key] for key in self.by_code.get(self.normalize(code), [])]
+
+    def values(self):
+        return self.records.values()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return key in self.records
+
+    def __getitem__(self, key):
+        return self.records[key]
+
+    def collision_report(self):
+        """Üzerine yazılan kayıtlar + birden fazla platformda paylaşılan kodlar."""
+        shared = {code: [key[0] for key in keys] for code, keys in self.by_code.items() if len(keys) > 1}
+        return {
+            "records": len(self.records),
+            "overwritten": self.overwrites,
+            "sharedCodes": shared,
+        }
@@ -0,0 +1,173 @@
+import os
+import re
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .query import open_index
+
+# Tek birleşik regex (bytes üzerinde). Grup adı token türünü, türü de olası platformları belirler.
+# Çıplak sayılar (zaman damgaları, PID'ler) gürültü olduğu için onluk kodlar sadece bağlamla yakalanır.
+# Her dal sabit bir ilk karakterle başlar (kelime sınırı kontrolü ilk karakterden sonra geriye bakarak yapılır);
+# böylece sre motoru aday olmayan pozisyonları tek karakter testiyle atlar. Anahtar kelimenin geri kalanı
+# ilk karaktere göre seçilir (errno|error|err|exit code, status, code, result, hr); bağlam satır sonunu aşmaz.
+TOKEN_RE = re.compile(rb"""
+    (?P<hex>0(?<![0-9A-Za-z_]0)[xX][0-9a-fA-F]{1,8})(?![0-9A-Za-z_])
+  | (?P<hresult>[8cC](?<![0-9A-Za-z_.\-][8cC])[0-9a-fA-F]{7})(?![0-9A-Za-z_.])
+  | (?P<signed>-(?<![0-9A-Za-z_]-)[12]\d{9})(?!\d)
+  | (?P<smtp>[245](?<![0-9A-Za-z_.][245])\.\d{1,3}\.\d{1,3})(?![0-9.])
+  | [sS](?i:qlstate)(?:[^\S\n]|[\[\]:=])*(?P<sqlstate>[0-9A-Z]{5})(?![0-9A-Za-z])
+  | "\x20(?P<http>[1-5]\d\d)\x20
+  | [eEsScCrRhH](?<![0-9A-Za-z_][eEsScCrRhH])
+    (?:(?<=[eE])(?i:rrno|rror|rr|xit\x20code)|(?<=[sS])(?i:tatus)|(?<=[cC])(?i:ode)|(?<=[rR])(?i:esult)|(?<=[hH])(?i:r))
+    (?:[^\S\n]|[:=\#(])*(?P<dec>-?\d{1,10})(?![0-9A-Za-z.])
+""", re.VERBOSE)
+
+KIND_PLATFORMS = {
+    "smtp": {"smtp"},
+    "sqlstate": {"database"},
+    "http": {"web"},
+}
+
+SEGMENT_SIZE = 64 * 1024 * 1024  # Büyük dosyalar bu boyutta parçalara bölünüp paralel taranır
+CHUNK_SIZE = 1024 * 1024         # Bir parçanın içinde okunan blok boyutu (bellek sınırı)
+MAX_JOB_HITS = 4096              # Bir iş bu kadar isabet biriktirince döner; segmentin kalanı devam işi olur
+MAX_LINE_TEXT = 200
+RESOLVE_CACHE_SIZE = 4096        # Bir işte çözülmüş token'lar (LRU); eşleşmeyen token'lar tutulmaz
+
+_index = None
+
+def _init_worker(db):
+    global _index
+    _index = open_index(db)
+
+def _is_utf16(path):
+    with open(path, 'rb') as f: head = f.read(2)
+    return head in (b'\xff\xfe', b'\xfe\xff')
+
+def plan_segments(paths, segment_size=SEGMENT_SIZE):
+    """(path, start, end) işleri; UTF-16 dosyalar bölünmez."""
+    jobs = []
+    for path in paths:
+        size = os.path.getsize(path)
+        if size <= segment_size or _is_utf16(path):
+            jobs.append((path, 0, size)); continue
+        for start in range(0, size, segment_size):
+            jobs.append((path, start, min(start + segment_size, size)))
+    return jobs
+
+def _iter_blocks(path, start, end):
+    """
+    Segmentin sahip olduğu satırları tam satırlar halinde CHUNK_SIZE bloklarla üretir: (blok, blok başı, sonraki konum).
+    Konumlar satır başıdır; segment oradan devam ettirilebilir. UTF-16'da blok başı None'dır (blok UTF-8'e
+    çevrildiği için içindeki konumlar dosyaya eşlenemez), sonraki konum metin dosyasının tell() çerezidir.
+    """
+    if _is_utf16(path):
+        with open(path, 'r', encoding='utf-16', errors='replace') as f:
+            if start: f.seek(start)
+            while True:
+                text = f.read(CHUNK_SIZE // 2)
+                if not text: break
+                text += f.readline()
+                yield text.encode('utf-8'), None, f.tell()
+        return
+    with open(path, 'rb') as f:
+        pos = start
+        if start > 0:
+            # Sınırı kesen satır önceki segmente aittir
+            f.seek(start - 1)
+            if f.read(1) != b'\n':
+                pos += len(f.readline())
+        f.seek(pos)
+        while pos < end:
+            block = f.read(min(CHUNK_SIZE, end - pos))
+            if not block: break
+            if not block.endswith(b'\n'): block += f.readline()
+            yield block, pos, pos + len(block)
+            pos += len(block)
+
+def _line_text(block, s, e):
+    ls = block.rfind(b'\n', 0, s) + 1
+    le = block.find(b'\n', e)
+    if le < 0: le = len(block)
+    return block[ls:le].decode('utf-8', errors='replace').strip()[:MAX_LINE_TEXT]
+
+def scan_segment(job, index=None):
+    """
+    Bir segmenti tarar. (path, satır sayısı, isabetler, devam işi) döndürür; satır numaraları işe göredir.
+    MAX_JOB_HITS isabete ulaşılınca o satırın sonunda (UTF-16'da blok sonunda) durur ve segmentin kalanını
+    devam işi olarak döndürür (yoksa None); böylece bir işin sonucu segment boyutundan bağımsız olarak sınırlı kalır.
+    """
+    path, start, end = job
+    index = index or _index
+    resolved = OrderedDict()
+    hits = []
+    line_base = 0
+    for block, block_start, next_pos in _iter_blocks(path, start, end):
+        last, line, cut = 0, line_base, None
+        for m in TOKEN_RE.finditer(block):
+            kind = m.lastgroup
+            s, e = m.span(kind)
+            if cut is not None and s >= cut:
+                return path, line_base + block.count(b'\n', 0, cut), hits, (path, block_start + cut, end)
+            token = m.group(kind).decode('ascii')
+            key = (kind, token)
+            matches = resolved.get(key)
+            if matches is not None: resolved.move_to_end(key)
+            else:
+                matches = index.lookup(token)
+                allowed = KIND_PLATFORMS.get(kind)
+                if allowed: matches = [obj for obj in matches if obj["platform"] in allowed]
+                if not matches: continue
+                resolved[key] = matches
+                if len(resolved) > RESOLVE_CACHE_SIZE: resolved.popitem(last=False)
+            line += block.count(b'\n', last, s); last = s
+            text = _line_text(block, s, e)
+            for obj in matches:
+                hits.append({
+                    "file": path, "line": line + 1, "token": token, "kind": kind,
+                    "code": obj["code"], "platform": obj["platform"], "name": obj["name"],
+                    "severity": obj.get("severity"), "products": obj.get("products", []), "text": text,
+                })
+            if cut is None and block_start is not None and len(hits) >= MAX_JOB_HITS:
+                cut = block.find(b'\n', e) + 1 or len(block)  # aynı satırdaki isabetler bu işte kalır
+        line_base += block.count(b'\n')
+        if len(hits) >= MAX_JOB_HITS and next_pos < end: return path, line_base, hits, (path, next_pos, end)
+    return path, line_base, hits, None
+
+def _ordered_results(jobs, db, workers):
+    """
+    İş sonuçlarını sırasıyla döndürür; aynı anda en fazla 2 x workers iş bekler.
+    Devam işi olan sonuçtan sonra önce o segmentin devamı gelir.
+    """
+    if workers == 1:
+        index = open_index(db)
+        for job in jobs:
+            while job:
+                path, lines, hits, job = scan_segment(job, index)
+                yield path, lines, hits
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(db,)) as pool:
+        def drain(future):
+            while future:
+                path, lines, hits, rest = future.result()
+                future = pool.submit(scan_segment, rest) if rest else None
+                yield path, lines, hits
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(scan_segment, job))
+            if len(pending) >= workers * 2: yield from drain(pending.popleft())
+        while pending: yield from drain(pending.popleft())
+
+def scan_files(paths, db=None, workers=None, segment_size=SEGMENT_SIZE):
+    """
+    Dosyaları süreç havuzunda tarar ve isabetleri dosya/satır sırasıyla üretir.
+    Her işçi index'i bir kez yükler; bekleyen her iş en fazla MAX_JOB_HITS (+ bir bloğun) isabetini tutar.
+    """
+    jobs = plan_segments(paths, segment_size)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    line_offsets = {}
+    for path, lines, hits in _ordered_results(jobs, db, workers):
+        base = line_offsets.get(path, 0)
+        for hit in hits:
+            hit["line"] += base
+            yield hit
+        line_offsets[path] = base + lines
@@ -1,117 +1,115 @@
-import requests
 import re
 import csv
 import io
-from .config import URLS, REGEX
+from .config import REGEX
 from .enrichment import to_unsigned_hex, title_case_name
-
-HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+from .fetcher import fetch_text, iter_chunks
+from .build_report import note_error, note_dropped
 
 def fetch_bsod():
-    errors = {}
+    errors = []
     print("    [-] Fetching BSOD data...")
     try:
-        r = requests.get(URLS["MS_BSOD"], headers=HEADERS)
-        matches = re.findall(REGEX["BSOD_LINK"], r.text)
+        matches = re.findall(REGEX["BSOD_LINK"], fetch_text("MS_BSOD"))
         for code_hex, slug in matches:
             try:
                 int_val = int(code_hex, 16)
                 display_code = to_unsigned_hex(int_val, force_pad=True).lower()
                 raw_name = slug.upper().replace('-', '_') if slug else f"BUGCHECK_{code_hex.upper()}"
-                errors[display_code] = {"code": display_code, "codeInt": int_val, "name": raw_name, "description": title_case_name(raw_name), "platform": "bsod", "source": "Microsoft Learn", "isCommon": False}
-            except: continue
-    except: pass
+                errors.append({"code": display_code, "codeInt": int_val, "name": raw_name, "description": title_case_name(raw_name), "platform": "bsod", "source": "Microsoft Learn", "isCommon": False})
+            except: note_dropped(); continue
+    except Exception as e: note_error("MS_BSOD", e)
     return errors
 
+# Windows header kaynakları: (URL anahtarı, source etiketi, platform, isim ön eki filtresi)
+WIN_SOURCES = [("WIN_WIN32", "Win32", "windows", None), ("WIN_UPDATE", "WindowsUpdate", "windows", r"WU_E_|CBS_"), ("WIN_NTSTATUS", "NTSTATUS", "windows", r"STATUS_")]
+# Kaynak başına tek derlenmiş desen; ön ek filtresi desenin içinde.
+WIN_PATTERNS = {key: re.compile(REGEX["WIN_DEFINE"].format(prefix=f"(?:{prefix_filter})" if prefix_filter else "[A-Z0-9_]")) for key, _, _, prefix_filter in WIN_SOURCES}
+LINUX_PATTERN = re.compile(REGEX["LINUX_DEFINE"])
+
+def parse_windows_header(chunks, pattern, source, plat):
+    """Header metnini parça parça işler ve kayıtları üretir (generator)."""
+    for chunk in chunks:
+        for match in pattern.finditer(chunk):
+            name, raw_val = match.groups()
+            if len(name) < 4: note_dropped(); continue
+            try:
+                raw_val = raw_val.replace('L', '')
+                int_val = int(raw_val, 16) if '0x' in raw_val else int(raw_val)
+                if int_val > 0x7FFFFFFF: int_val -= 0x100000000
+                yield {"code": to_unsigned_hex(int_val).lower(), "codeInt": int_val, "name": name, "description": name.replace('_', ' ').title(), "platform": plat, "source": source, "isCommon": False}
+            except: note_dropped(); continue
+
+def parse_linux_header(chunks):
+    for chunk in chunks:
+        for m in LINUX_PATTERN.finditer(chunk):
+            yield {"code": m.group(2), "codeInt": int(m.group(2)), "name": m.group(1), "description": m.group(3), "platform": "linux", "source": "Linux Kernel", "isCommon": False}
+
 def fetch_windows_headers():
-    errors = {}
+    errors = []
     print("    [-] Fetching Windows Headers...")
-    sources = [(URLS["WIN_WIN32"], "Win32", "windows", None), (URLS["WIN_UPDATE"], "WindowsUpdate", "windows", r"WU_E_|CBS_"), (URLS["WIN_NTSTATUS"], "NTSTATUS", "windows", r"STATUS_")]
-    regex = re.compile(REGEX["WIN_DEFINE"])
-    for url, source, plat, prefix_filter in sources:
-        count = 0
-        try:
-            r = requests.get(url); text = r.text
-            for line in text.splitlines():
-                match = regex.search(line)
-                if match:
-                    name = match.group(1); raw_val = match.group(2)
-                    if prefix_filter and not re.match(prefix_filter, name): continue
-                    if len(name) < 4: continue
-                    try:
-                        raw_val = raw_val.replace('L', '')
-                        int_val = int(raw_val, 16) if '0x' in raw_val else int(raw_val)
-                        if int_val > 0x7FFFFFFF: int_val -= 0x100000000
-                        display_code = to_unsigned_hex(int_val).lower()
-                        errors[display_code] = {"code": display_code, "codeInt": int_val, "name": name, "description": name.replace('_', ' ').title(), "platform": plat, "source": source, "isCommon": False}
-                        count += 1
-                    except: continue
-        except: pass
-        print(f"        [OK] {source}: {count}")
+    for key, source, plat, _ in WIN_SOURCES:
+        count = len(errors)
+        try: errors.extend(parse_windows_header(iter_chunks(key), WIN_PATTERNS[key], source, plat))
+        except Exception as e: note_error(key, e)
+        print(f"        [OK] {source}: {len(errors) - count}")
     return errors
 
 def fetch_postgres():
-    errors = {}
+    errors = []
     print("    [-] Fetching PostgreSQL...")
     try:
-        r = requests.get(URLS["POSTGRES"])
-        for line in r.text.splitlines():
+        for line in fetch_text("POSTGRES").splitlines():
             parts = line.split()
             if len(parts) >= 3 and len(parts[0]) == 5 and parts[0].isalnum():
-                errors[parts[0]] = {"code": parts[0], "codeInt": 0, "name": parts[2], "description": "PostgreSQL Error", "platform": "database", "source": "PostgreSQL", "isCommon": False}
-    except: pass
+                errors.append({"code": parts[0], "codeInt": 0, "name": parts[2], "description": "PostgreSQL Error", "platform": "database", "source": "PostgreSQL", "isCommon": False})
+    except Exception as e: note_error("POSTGRES", e)
     return errors
 
 def fetch_kubernetes():
-    errors = {}
+    errors = []
     print("    [-] Fetching Kubernetes (K8s)...")
     try:
-        r = requests.get(URLS["K8S_TYPES"]); text = r.text
+        text = fetch_text("K8S_TYPES")
         matches = re.findall(r'const\s+([A-Z][a-zA-Z0-9]+)\s*.*=\s*"([^"]+)"', text)
         for name, val in matches:
-            if len(val) < 3 or " " in val: continue
-            errors[val] = {"code": val, "codeInt": 0, "name": name, "description": f"Kubernetes Pod/Container Status: {val}", "platform": "container", "source": "Kubernetes Git", "isCommon": False}
-    except: pass
+            if len(val) < 3 or " " in val: note_dropped(); continue
+            errors.append({"code": val, "codeInt": 0, "name": name, "description": f"Kubernetes Pod/Container Status: {val}", "platform": "container", "source": "Kubernetes Git", "isCommon": False})
+    except Exception as e: note_error("K8S_TYPES", e)
     try:
-        r = requests.get(URLS["K8S_ERRORS"]); text = r.text
+        text = fetch_text("K8S_ERRORS")
         matches = re.findall(r'const\s+(StatusReason[A-Z][a-zA-Z0-9]+)\s*StatusReason\s*=\s*"([^"]+)"', text)
         for name, val in matches:
-            errors[val] = {"code": val, "codeInt": 0, "name": name, "description": f"Kubernetes API Status Reason: {val}", "platform": "container", "source": "Kubernetes Git", "isCommon": True}
-    except: pass
+            errors.append({"code": val, "codeInt": 0, "name": name, "description": f"Kubernetes API Status Reason: {val}", "platform": "container", "source": "Kubernetes Git", "isCommon": True})
+    except Exception as e: note_error("K8S_ERRORS", e)
     print(f"        [OK] Kubernetes: {len(errors)}")
     return errors
 
 def fetch_standards():
-    errors = {}
+    errors = []
     print("    [-] Fetching Standards...")
     
     # Linux
-    c_lin = 0
-    try:
-        for url in [URLS["LINUX_BASE"], URLS["LINUX_ADV"]]:
-            r = requests.get(url)
-            for line in r.text.splitlines():
-                m = re.search(REGEX["LINUX_DEFINE"], line)
-                if m: errors[m.group(2)] = {"code": m.group(2), "codeInt": int(m.group(2)), "name": m.group(1), "description": m.group(3), "platform": "linux", "source": "Linux Kernel", "isCommon": False}; c_lin += 1
-    except: pass
-    print(f"        [OK] Linux: {c_lin}")
+    c_lin = len(errors)
+    for key in ["LINUX_BASE", "LINUX_ADV"]:
+        try: errors.extend(parse_linux_header(iter_chunks(key)))
+        except Exception as e: note_error(key, e)
+    print(f"        [OK] Linux: {len(errors) - c_lin}")
 
     # HTTP
     c_http = 0
     try:
-        r = requests.get(URLS["HTTP"]); r.encoding='utf-8'
-        reader = csv.reader(io.StringIO(r.text)); next(reader)
+        reader = csv.reader(io.StringIO(fetch_text("HTTP"))); next(reader)
         for row in reader:
-            if len(row)>1 and row[0].isdigit(): errors[row[0]] = {"code": row[0], "codeInt": int(row[0]), "name": f"HTTP_{row[0]}", "description": row[1], "platform": "web", "source": "IANA", "isCommon": False}; c_http += 1
-    except: pass
+            if len(row)>1 and not row[0].isdigit(): note_dropped()
+            elif len(row)>1: errors.append({"code": row[0], "codeInt": int(row[0]), "name": f"HTTP_{row[0]}", "description": row[1], "platform": "web", "source": "IANA", "isCommon": False}); c_http += 1
+    except Exception as e: note_error("HTTP", e)
     print(f"        [OK] HTTP: {c_http}")
 
     # SMTP (ULTRA AGGRESSIVE MODE)
     c_smtp = 0
     try:
-        r = requests.get(URLS["SMTP"])
-        r.encoding = 'utf-8'
-        raw_text = r.text
+        raw_text = fetch_text("SMTP")
         
         # Debug: Bakalım veri geliyor mu?
         print(f"        [DEBUG] SMTP Raw Length: {len(raw_text)}")
@@ -137,7 +135,7 @@ def fetch_standards():
                         desc = clean_p
                         break
                 
-                errors[code] = {
+                errors.append({
                     "code": code,
                     "codeInt": 0,
                     "name": f"SMTP_{code}",
@@ -145,9 +143,20 @@ def fetch_standards():
                     "platform": "smtp",
                     "source": "IANA",
                     "isCommon": False
-                }
+                })
                 c_smtp += 1
-    except Exception as e: print(f"        [!] SMTP Error: {e}")
+    except Exception as e: note_error("SMTP", e)
     print(f"        [OK] SMTP: {c_smtp}")
 
-    return errors
\ No newline at end of file
+    return errors
+
+
+# Kaynak adı -> (fetcher, kullandığı URL anahtarları). Her fetcher kayıt listesi döndürür.
+# Liste sırası birleştirme önceliğidir: indirmeler hangi sırayla biterse bitsin sonuç aynı kalır.
+SOURCES = [
+    ("bsod", fetch_bsod, ("MS_BSOD",)),
+    ("windows", fetch_windows_headers, ("WIN_WIN32", "WIN_UPDATE", "WIN_NTSTATUS")),
+    ("postgres", fetch_postgres, ("POSTGRES",)),
+    ("standards", fetch_standards, ("LINUX_BASE", "LINUX_ADV", "HTTP", "SMTP")),
+    ("kubernetes", fetch_kubernetes, ("K8S_TYPES", "K8S_ERRORS")),
+]
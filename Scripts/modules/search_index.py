@@ -0,0 +1,137 @@
+import os
+import re
+import json
+from .config import SHARD_DIR
+from .enrichment import to_unsigned_hex
+
+# Arama indeksi (public/db/search-index.json):
+#   buildId -> SEARCH_FIELDS hash'i; manifest.json da aynısını taşır (servis ikisi eşleşince yükler)
+#   order -> sıra pozisyonu -> kayıt id'si (isCommon önce, sonra doğal isim/kod sırası)
+#   grams -> küçük harf trigram -> sıra pozisyonları (artan, delta kodlu)
+#   codes -> alt-string filtresinin bulamadığı kod biçimleri (signed/unsigned onluk, dolgulu/dolgusuz hex) -> sıra pozisyonları;
+#            terim bunlardan birine birebir eşitse kayıt trigram adaylarına eklenir ve filtreden geçer
+# Posting listeleri sıra pozisyonu tuttuğu için kesişim sonucu zaten sıralıdır; istemci sort yapmaz.
+INDEX_VERSION = 1
+SEARCH_FIELDS = ("code", "codeInt", "name", "description", "isCommon")  # İndeks sadece bu alanlardan (ve kayıt sırasından) türer
+GRAM = 3
+FIELD_SEP = "\u0001"  # Trigramların alan sınırını aşmasını engeller
+
+# ICU kök harmanlamasına yakın sıra: boşluk < noktalama/sembol < rakam < harf
+_PUNCT_ORDER = "_-,;:!?.'\"()[]{}@*/\\&#%`^+<=>|~$"
+_CHUNK = re.compile(r'\d+|\D')
+
+def natural_key(text):
+    """localeCompare(..., {numeric: true, sensitivity: "base"}) yaklaşığı."""
+    key = []
+    for chunk in _CHUNK.findall(text or ""):
+        if chunk.isdigit(): key.append((2, int(chunk)))
+        elif chunk.isspace(): key.append((0, 0))
+        elif chunk.isalpha(): key.append((3, ord(chunk.casefold()[0])))
+        else:
+            idx = _PUNCT_ORDER.find(chunk)
+            key.append((1, idx if idx >= 0 else len(_PUNCT_ORDER) + ord(chunk)))
+    return key
+
+def rank_order(records):
+    return sorted(range(len(records)), key=lambda i: (not records[i].get("isCommon"), natural_key(records[i].get("name")), natural_key(records[i].get("code"))))
+
+def code_forms(obj):
+    """
+    Hex kodların sayfadaki alt-string filtresinin (kod, codeInt) bulamadığı birebir biçimleri:
+    signed/unsigned onluk, dolgulu/dolgusuz hex (küçük harf).
+    """
+    code = str(obj.get("code", "")).lower()
+    if not code.startswith("0x"): return set()
+    try: value = int(code, 16)
+    except ValueError: return set()
+    if value > 0xFFFFFFFF: return set()
+    forms = {str(value), str(value - (1 << 32) if value & 0x80000000 else value), to_unsigned_hex(value), to_unsigned_hex(value, force_pad=True), f"{value:08x}"}
+    shown = str(obj.get("codeInt", 0)).lower()
+    return {form for form in forms if form not in code and form not in shown}
+
+def search_text(obj):
+    """Sayfadaki filtrenin baktığı alanlar; ek kod biçimleri trigram'a değil codes haritasına girer."""
+    fields = [str(obj.get("code", "")), str(obj.get("codeInt", 0)), obj.get("name") or "", obj.get("description") or ""]
+    return FIELD_SEP.join(fields).lower()
+
+def grams_of(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1) if FIELD_SEP not in text[i:i + GRAM]}
+
+def _delta(positions):
+    prev, out = 0, []
+    for p in positions:
+        out.append(p - prev); prev = p
+    return out
+
+def build_search_index(records, build_id=None):
+    order = rank_order(records)
+    grams, codes = {}, {}
+    for pos, rid in enumerate(order):
+        obj = records[rid]
+        for g in grams_of(search_text(obj)): grams.setdefault(g, []).append(pos)
+        for form in code_forms(obj): codes.setdefault(form, []).append(pos)
+    return {
+        "version": INDEX_VERSION,
+        "buildId": build_id,
+        "total": len(records),
+        "gram": GRAM,
+        "order": order,
+        "grams": {g: _delta(p) for g, p in sorted(grams.items())},
+        "codes": dict(sorted(codes.items())),
+    }
+
+def write_search_index(records, out_dir=SHARD_DIR, build_id=None):
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, "search-index.json")
+    with open(path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(build_search_index(records, build_id), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(path + ".tmp", path)
+    return path
+
+def load_search_index(out_dir=SHARD_DIR):
+    with open(os.path.join(out_dir, "search-index.json"), 'r', encoding='utf-8') as f: return SearchIndex(json.load(f))
+
+def matches_term(obj, term):
+    """Sayfadaki filtreyle aynı: kod, codeInt, isim veya açıklama terimi (küçük harf) içeriyor mu."""
+    return (term in str(obj.get("code", "")).lower() or term in str(obj.get("codeInt", 0)).lower()
+            or term in (obj.get("name") or "").lower() or term in (obj.get("description") or "").lower())
+
+class SearchIndex:
+    """search-index.json okuyucusu (src/lib/search-index.ts ile aynı aday mantığı)."""
+    def __init__(self, data):
+        self.total = data["total"]
+        self.build_id = data.get("buildId")
+        self.gram = data["gram"]
+        self.order = data["order"]
+        self.grams = data["grams"]
+        self.codes = data.get("codes", {})
+        self._decoded = {}
+
+    def postings(self, gram):
+        out = self._decoded.get(gram)
+        if out is None:
+            acc, out = 0, []
+            for d in self.grams.get(gram, ()):
+                acc += d; out.append(acc)
+            self._decoded[gram] = out
+        return out
+
+    def code_ids(self, term):
+        """Terimle birebir eşleşen ek kod biçimlerinin kayıt id'leri (filtreden muaf)."""
+        return {self.order[pos] for pos in self.codes.get(term.strip().lower(), ())}
+
+    def candidates(self, term):
+        """Terimin tüm trigramlarını içeren ya da kod biçimi terime eşit kayıt id'leri (sıra düzeninde); terim trigramdan kısaysa None."""
+        t = term.lower()
+        if len(t) < self.gram: return None
+        grams = {t[i:i + self.gram] for i in range(len(t) - self.gram + 1)}
+        acc = []
+        if all(g in self.grams for g in grams):
+            lists = sorted((self.postings(g) for g in grams), key=len)
+            acc = lists[0]
+            for other in lists[1:]:
+                if not acc: break
+                acc = sorted(set(acc).intersection(other))
+        exact = self.codes.get(t.strip())
+        if exact: acc = sorted(set(acc).union(exact))
+        return [self.order[pos] for pos in acc]
@@ -0,0 +1,204 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+from .config import SHARD_DIR
+from .query import CodeIndex
+from .shards import load_records
+from .search_index import load_search_index, matches_term
+
+# Servis sınırları
+DEFAULT_CACHE_SIZE = 4096
+MAX_BATCH = 10000
+MAX_LIMIT = 1000
+RELOAD_FILES = ["manifest.json", "search-index.json"]  # update_db search-index.json'u en son yazar
+
+class LRUCache:
+    """Kilitli, boyut sınırlı LRU (sorgu anahtarı -> kodlanmış yanıt gövdesi)."""
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0: return value
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize: self.data.popitem(last=False)
+        return value
+
+    def stats(self):
+        return {"size": len(self.data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+def _encode(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def db_signature(db_dir):
+    """Yeniden yükleme tetikleyicisi: izlenen dosyaların (mtime, boyut) listesi."""
+    out = []
+    for name in RELOAD_FILES:
+        try: st = os.stat(os.path.join(db_dir, name))
+        except FileNotFoundError: return None
+        out.append((st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+class Snapshot:
+    """
+    Veritabanının değişmez bir kopyası: kayıtlar, kod index'i, arama index'i ve kendi yanıt önbelleği.
+    Yeniden yüklemede yenisi kurulup referans tek atamayla değiştirilir; süren istekler eski kopyayı kullanmaya devam eder.
+    """
+    def __init__(self, db_dir, cache_size, generation):
+        self.signature = db_signature(db_dir)
+        with open(os.path.join(db_dir, "manifest.json"), 'r', encoding='utf-8') as f: self.build_id = json.load(f).get("buildId")
+        self.records = load_records(db_dir)
+        self.codes = CodeIndex(self.records)
+        self.search_index = load_search_index(db_dir)
+        # Shard'lar ve manifest yazıldıktan sonra search-index.json'dan önce (fuzzy index yazılırken) gelen bir
+        # tur yeni kayıtları eski arama indeksiyle eşlerdi; iki dosyanın build kimliği aynı olmalı.
+        if self.search_index.build_id != self.build_id:
+            raise ValueError(f"build in progress (manifest {self.build_id}, search index {self.search_index.build_id})")
+        if self.search_index.total != len(self.records) or db_signature(db_dir) != self.signature:
+            raise ValueError("database changed while loading (shards and search index disagree)")
+        self.cache = LRUCache(cache_size)
+        self.generation = generation
+        self.loaded_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+    def code(self, token):
+        key = ("code", token)
+        body = self.cache.get(key)
+        if body is None:
+            matches = self.codes.lookup(token)
+            body = self.cache.put(key, (200 if matches else 404, _encode({"query": token, "matches": matches})))
+        return body
+
+    def search(self, term, platform=None, common=False, limit=50, offset=0):
+        term = term.strip().lower()
+        key = ("search", term, platform, common, limit, offset)
+        body = self.cache.get(key)
+        if body is None:
+            ids = (self.search_index.candidates(term) if term else None)
+            if ids is None: ids = self.search_index.order
+            exact = self.search_index.code_ids(term) if term else ()
+            hits = []
+            for rid in ids:
+                obj = self.records[rid]
+                if platform and obj.get("platform") != platform: continue
+                if common and not obj.get("isCommon"): continue
+                if term and rid not in exact and not matches_term(obj, term): continue
+                hits.append(obj)
+            body = self.cache.put(key, (200, _encode({"query": term, "total": len(hits), "results": hits[offset:offset + limit]})))
+        return body
+
+    def batch(self, tokens):
+        return 200, _encode({"results": [{"query": token, "matches": matches} for token, matches in self.codes.lookup_many(tokens)]})
+
+class ErrorService:
+    """Güncel Snapshot'ı tutar ve veritabanı dosyaları değişince arka planda yeniden yükler."""
+    def __init__(self, db_dir=SHARD_DIR, cache_size=DEFAULT_CACHE_SIZE, reload_interval=2.0):
+        self.db_dir = db_dir
+        self.cache_size = cache_size
+        self.reload_interval = reload_interval
+        self.snapshot = Snapshot(db_dir, cache_size, 1)
+        self.reload_errors = 0
+        self._stop = threading.Event()
+
+    def reload_if_changed(self):
+        signature = db_signature(self.db_dir)
+        if signature is None or signature == self.snapshot.signature: return False
+        try: snapshot = Snapshot(self.db_dir, self.cache_size, self.snapshot.generation + 1)
+        except (OSError, ValueError, KeyError) as e:
+            # Yazım sürüyor olabilir; bir sonraki turda tekrar denenir.
+            self.reload_errors += 1
+            print(f"[!] reload skipped: {e.__class__.__name__}: {e}")
+            return False
+        self.snapshot = snapshot
+        print(f"[*] reloaded {len(snapshot.records)} records (generation {snapshot.generation})")
+        return True
+
+    def watch(self):
+        while not self._stop.wait(self.reload_interval): self.reload_if_changed()
+
+    def start_watcher(self):
+        if self.reload_interval > 0: threading.Thread(target=self.watch, name="db-watcher", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def health(self):
+        snap = self.snapshot
+        return 200, _encode({"records": len(snap.records), "buildId": snap.build_id, "generation": snap.generation, "loadedAt": snap.loaded_at, "reloadErrors": self.reload_errors, "cache": snap.cache.stats()})
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    GET  /code/<kod>                                        -> {"query", "matches": [...]} (bulunamazsa 404)
+    GET  /search?q=&platform=&common=1&limit=50&offset=0    -> {"query", "total", "results": [...]}
+    POST /batch  {"codes": [...]} veya [...]                -> {"results": [{"query", "matches"}, ...]}
+    GET  /health                                            -> kayıt sayısı, yükleme nesli, önbellek istatistikleri
+    """
+    protocol_version = "HTTP/1.1"  # keep-alive: yük testinde bağlantı başına tek TCP el sıkışması
+    # Başlık + gövde tek segmentte gider (istek sonunda flush); Nagle + gecikmeli ACK ~40 ms bekletmesin.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    server_version = "ErrorCodeService/1"
+    service = None
+    quiet = True
+
+    def send_body(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_body(status, _encode({"error": message}))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        snap = self.service.snapshot
+        if url.path.startswith("/code/") and len(url.path) > 6:
+            return self.send_body(*snap.code(unquote(url.path[6:])))
+        if url.path == "/search":
+            query = parse_qs(url.query)
+            arg = lambda name, default="": query.get(name, [default])[0]
+            try: limit, offset = max(0, min(int(arg("limit", "50")), MAX_LIMIT)), max(int(arg("offset", "0")), 0)
+            except ValueError: return self.send_error_json(400, "limit and offset must be integers")
+            return self.send_body(*snap.search(arg("q"), arg("platform") or None, arg("common") in ("1", "true"), limit, offset))
+        if url.path == "/health":
+            return self.send_body(*self.service.health())
+        self.send_error_json(404, "unknown endpoint")
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/batch": return self.send_error_json(404, "unknown endpoint")
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"null")
+            tokens = payload.get("codes") if isinstance(payload, dict) else payload
+            if not isinstance(tokens, list): raise ValueError("expected {\"codes\": [...]} or a JSON list")
+        except ValueError as e:
+            return self.send_error_json(400, str(e))
+        if len(tokens) > MAX_BATCH: return self.send_error_json(413, f"at most {MAX_BATCH} codes per batch")
+        self.send_body(*self.service.snapshot.batch([str(t) for t in tokens]))
+
+    def log_message(self, format, *args):
+        if not self.quiet: super().log_message(format, *args)
+
+def make_server(service, host="127.0.0.1", port=8787, quiet=True):
+    handler = type("BoundHandler", (Handler,), {"service": service, "quiet": quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
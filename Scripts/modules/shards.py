@@ -0,0 +1,116 @@
+import os
+import json
+import hashlib
+from .config import SHARD_DIR
+
+# Kompakt çıktı formatı (public/db/):
+#   manifest.json  -> alan listesi, ortak string tablosu, docUrl şablonları, shard listesi, buildId
+#   <platform>.json -> {"platform", "rows": [[...], ...]}  (satırlar FIELDS sırasında)
+# source / severity / products / likelySeenIn değerleri string tablosuna indekstir.
+# docUrl platform şablonuyla aynıysa 0 yazılır; istemci şablondan üretir.
+FORMAT_VERSION = 1
+FIELDS = ["id", "code", "codeInt", "name", "description", "source", "solutionHint", "docUrl", "severity", "isCommon", "runbook", "likelySeenIn", "products"]
+DOC_URL_TEMPLATES = {
+    "linux": "https://man7.org/linux/man-pages/man3/errno.3.html",
+    "web": "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/{code}",
+    "windows": "https://learn.microsoft.com/en-us/search/?terms={code}",
+    "container": "https://kubernetes.io/search/?q={code}",
+}
+
+class StringTable:
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def intern(self, value):
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def _write_if_changed(path, text):
+    data = text.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data: return len(data)
+    with open(path + ".tmp", 'wb') as f: f.write(data)
+    os.replace(path + ".tmp", path)
+    return len(data)
+
+def encode_row(rid, obj, strings):
+    platform = obj.get("platform", "windows")
+    doc_url = obj.get("docUrl") or None
+    template = DOC_URL_TEMPLATES.get(platform)
+    if doc_url and template and doc_url == template.format(code=obj.get("code")): doc_url = 0
+    return [
+        rid,
+        obj.get("code"),
+        obj.get("codeInt", 0),
+        obj.get("name"),
+        obj.get("description", ""),
+        strings.intern(obj.get("source", "Custom")),
+        obj.get("solutionHint") or None,
+        doc_url,
+        strings.intern(obj.get("severity", "Error")),
+        1 if obj.get("isCommon") else 0,
+        obj.get("runbook"),
+        [strings.intern(v) for v in obj.get("likelySeenIn") or []],
+        [strings.intern(v) for v in obj.get("products") or []],
+    ]
+
+def write_shards(records, out_dir=SHARD_DIR, build_id=None):
+    """
+    Kayıtları platform shard'larına böler; değişmeyen dosyalara dokunmaz. Manifest yolunu döndürür.
+    build_id search-index.json'a da yazılır; okuyucular ikisi eşleşmezse yarım kalmış bir build görüyordur.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    strings = StringTable()
+    rows = {}
+    for rid, obj in enumerate(records):
+        rows.setdefault(obj.get("platform", "windows"), []).append(encode_row(rid, obj, strings))
+    shards = {}
+    for platform in sorted(rows):
+        text = _dumps({"platform": platform, "rows": rows[platform]})
+        file_name = f"{platform}.json"
+        size = _write_if_changed(os.path.join(out_dir, file_name), text)
+        shards[platform] = {"file": file_name, "count": len(rows[platform]), "bytes": size, "sha256": hashlib.sha256(text.encode('utf-8')).hexdigest()}
+    manifest = {
+        "version": FORMAT_VERSION,
+        "buildId": build_id,
+        "total": sum(s["count"] for s in shards.values()),
+        "fields": FIELDS,
+        "strings": strings.values,
+        "docUrlTemplates": DOC_URL_TEMPLATES,
+        "shards": shards,
+    }
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    _write_if_changed(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2))
+    return manifest_path
+
+def decode_row(row, platform, manifest):
+    """encode_row'un tersi; ErrorCode şeklinde dict döndürür."""
+    obj = dict(zip(manifest["fields"], row))
+    strings = manifest["strings"]
+    obj["platform"] = platform
+    obj["source"] = strings[obj["source"]]
+    obj["severity"] = strings[obj["severity"]]
+    obj["isCommon"] = bool(obj["isCommon"])
+    obj["likelySeenIn"] = [strings[i] for i in obj["likelySeenIn"]]
+    obj["products"] = [strings[i] for i in obj["products"]]
+    if obj["docUrl"] == 0: obj["docUrl"] = manifest["docUrlTemplates"][platform].format(code=obj["code"])
+    return obj
+
+def load_records(out_dir=SHARD_DIR, platforms=None):
+    """Shard'ları okuyup kayıtları build sırasıyla (id) döndürür."""
+    with open(os.path.join(out_dir, "manifest.json"), 'r', encoding='utf-8') as f: manifest = json.load(f)
+    records = []
+    for platform, info in manifest["shards"].items():
+        if platforms and platform not in platforms: continue
+        with open(os.path.join(out_dir, info["file"]), 'r', encoding='utf-8') as f: shard = json.load(f)
+        records.extend(decode_row(row, platform, manifest) for row in shard["rows"])
+    records.sort(key=lambda obj: obj["id"])
+    return records
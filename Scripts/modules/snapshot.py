@@ -0,0 +1,210 @@
+import os
+import sys
+import json
+import mmap
+import struct
+from bisect import bisect_left
+from collections import OrderedDict
+from .config import SNAPSHOT_FILE
+from .query import normalize_code, record_keys
+
+# Birleştirilmiş veritabanının ikili anlık görüntüsü (data/error-db.bin).
+# Python tüketicileri dosyayı mmap ile açar; parse yoktur, kayıtlar istendikçe çözülür.
+#
+#   header      MAGIC, sürüm, sayılar, bölüm ofsetleri (HEADER)
+#   records     sabit boyutlu satırlar (RECORD); string alanları string havuzuna indekstir, NONE = yok
+#   str_offsets n_strings + 1 adet u32: string i = str_data[off[i]:off[i+1]] (utf-8)
+#   str_data    string havuzu (tekrarlar tek kopya)
+#   list_offsets/list_items  likelySeenIn / products listeleri: n_lists + 1 adet u32 öğe ofseti + string id dizisi
+#   keys        (anahtar string id, kayıt id) çiftleri; anahtar baytlarına, sonra kayıt id'sine göre sıralı.
+#               Anahtarlar query.record_keys ile aynıdır.
+#   key_prefixes keys ile hizalı u64 dizisi: anahtarın ilk 8 baytı (big-endian, sıfır dolgulu) sayı olarak.
+#               Sıralıdır; ikili arama bu dizide (C seviyesinde) yapılır, aynı öneki taşıyan az sayıda
+#               anahtar tam karşılaştırılır. Öneki olmayan token'lar (logdaki çoğu aday) string havuzuna hiç inmez.
+# Tüm sayılar little-endian.
+MAGIC = b"ECDB"
+VERSION = 2
+NONE = 0xFFFFFFFF
+HEADER = struct.Struct("<4sHHIIII7Q")
+RECORD = struct.Struct("<IqIIIIIIIIIIB3x")  # code, codeInt, name, description, platform, source, solutionHint, docUrl, severity, runbook, likelySeenIn, products, isCommon
+KEY = struct.Struct("<II")
+U32_PAIR = struct.Struct("<II")
+IDS_CACHE_SIZE = 4096  # Son çözülen anahtarların kayıt id'leri (LRU); eşleşmeyen anahtarlar tutulmaz
+
+class _Pool:
+    def __init__(self):
+        self.values, self.index = [], {}
+
+    def add(self, value):
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+def key_prefix(key):
+    """Anahtar baytlarının ilk 8'i sayı olarak; bayt sırası ile sayı sırası aynıdır."""
+    return int.from_bytes(key[:8].ljust(8, b"\0"), 'big')
+
+def _offsets(sizes):
+    out, acc = [0], 0
+    for size in sizes:
+        acc += size; out.append(acc)
+    return struct.pack(f"<{len(out)}I", *out)
+
+def build_snapshot(records):
+    """Kayıt listesini (build sırasıyla) snapshot baytlarına çevirir."""
+    strings, lists = _Pool(), _Pool()
+    opt = lambda value: strings.add(value) if value else NONE
+    rows = bytearray()
+    keys = []
+    for rid, obj in enumerate(records):
+        runbook = obj.get("runbook")
+        rows += RECORD.pack(
+            strings.add(str(obj.get("code"))), obj.get("codeInt") or 0, strings.add(str(obj.get("name"))),
+            strings.add(obj.get("description") or ""), strings.add(obj.get("platform", "windows")),
+            strings.add(obj.get("source", "Custom")), opt(obj.get("solutionHint")), opt(obj.get("docUrl")),
+            strings.add(obj.get("severity", "Error")), strings.add(json.dumps(runbook, ensure_ascii=False)) if runbook else NONE,
+            lists.add(tuple(map(strings.add, obj.get("likelySeenIn") or []))), lists.add(tuple(map(strings.add, obj.get("products") or []))),
+            1 if obj.get("isCommon") else 0,
+        )
+        for key in record_keys(obj): keys.append((key.encode('utf-8'), rid))
+    keys.sort()
+    key_table = b"".join(KEY.pack(strings.add(key.decode('utf-8')), rid) for key, rid in keys)
+
+    encoded = [s.encode('utf-8') for s in strings.values]
+    sections = [
+        bytes(rows),
+        _offsets(map(len, encoded)),
+        b"".join(encoded),
+        _offsets(map(len, lists.values)),
+        b"".join(struct.pack(f"<{len(items)}I", *items) for items in lists.values),
+        key_table,
+        struct.pack(f"<{len(keys)}Q", *(key_prefix(key) for key, _ in keys)),
+    ]
+    offsets, pos = [], HEADER.size
+    for data in sections:
+        pos += -pos % 8  # bölümler 8 bayt hizalı
+        offsets.append(pos); pos += len(data)
+    out = bytearray(HEADER.pack(MAGIC, VERSION, 0, len(records), len(strings.values), len(lists.values), len(keys), *offsets))
+    for offset, data in zip(offsets, sections):
+        out += b"\0" * (offset - len(out)); out += data
+    return bytes(out)
+
+def write_snapshot(records, path=SNAPSHOT_FILE):
+    """Snapshot'ı atomik yazar (tmp + os.replace); içerik aynıysa dosyaya dokunmaz."""
+    data = build_snapshot(records)
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        with open(path, 'rb') as f:
+            if f.read() == data: return path
+    with open(path + ".tmp", 'wb') as f: f.write(data)
+    os.replace(path + ".tmp", path)
+    return path
+
+class _Records:
+    """snapshot.records: liste gibi davranan, kayıtları istendikçe çözen görünüm."""
+    def __init__(self, db):
+        self.db = db
+
+    def __len__(self):
+        return self.db.n_records
+
+    def __getitem__(self, rid):
+        if rid < 0: rid += self.db.n_records
+        if not 0 <= rid < self.db.n_records: raise IndexError(rid)
+        return self.db.record(rid)
+
+    def __iter__(self):
+        return map(self.db.record, range(self.db.n_records))
+
+class SnapshotIndex:
+    """
+    error-db.bin okuyucusu; query.CodeIndex ile aynı lookup / lookup_many arayüzü.
+    Açılış sadece mmap + başlık okumasıdır; bir lookup O(log n) anahtar karşılaştırması ve eşleşen kayıtların çözümüdür.
+    """
+    def __init__(self, path=SNAPSHOT_FILE):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self.mm)
+        magic, version, _, self.n_records, self.n_strings, self.n_lists, self.n_keys, *offsets = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an error-db snapshot (version {VERSION})")
+        self.records_at, self.str_offsets_at, self.str_data_at, self.list_offsets_at, self.list_items_at, self.keys_at, prefixes_at = offsets
+        self.records = _Records(self)
+        prefixes = self.buf[prefixes_at:prefixes_at + self.n_keys * 8]
+        self._prefixes = prefixes.cast('Q') if sys.byteorder == 'little' else struct.unpack(f"<{self.n_keys}Q", prefixes)
+        self._strings = {}
+        self._decoded = {}  # Çözülen kayıtlar (CodeIndex gibi aynı dict tekrar döner)
+        self._ids = OrderedDict()
+
+    def close(self):
+        if isinstance(getattr(self, "_prefixes", None), memoryview): self._prefixes.release()
+        self.buf.release()
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.n_records
+
+    def string_bytes(self, sid):
+        start, end = U32_PAIR.unpack_from(self.buf, self.str_offsets_at + sid * 4)
+        return self.mm[self.str_data_at + start:self.str_data_at + end]
+
+    def string(self, sid):
+        value = self._strings.get(sid)
+        if value is None: value = self._strings[sid] = self.string_bytes(sid).decode('utf-8')
+        return value
+
+    def _list(self, lid):
+        start, end = U32_PAIR.unpack_from(self.buf, self.list_offsets_at + lid * 4)
+        return [self.string(sid) for sid in struct.unpack_from(f"<{end - start}I", self.buf, self.list_items_at + start * 4)]
+
+    def record(self, rid):
+        """Kaydı shards.decode_row ile aynı biçimde dict olarak çözer."""
+        obj = self._decoded.get(rid)
+        if obj is None: obj = self._decoded[rid] = self._decode(rid)
+        return obj
+
+    def _decode(self, rid):
+        code, code_int, name, desc, platform, source, hint, doc_url, severity, runbook, seen, products, is_common = RECORD.unpack_from(self.buf, self.records_at + rid * RECORD.size)
+        s = self.string
+        return {
+            "id": rid, "code": s(code), "codeInt": code_int, "name": s(name), "description": s(desc),
+            "source": s(source), "solutionHint": None if hint == NONE else s(hint), "docUrl": None if doc_url == NONE else s(doc_url),
+            "severity": s(severity), "isCommon": bool(is_common), "runbook": None if runbook == NONE else json.loads(s(runbook)),
+            "likelySeenIn": self._list(seen), "products": self._list(products), "platform": s(platform),
+        }
+
+    def ids(self, key):
+        """Normalize anahtarın kayıt id'leri (build sırasıyla)."""
+        out = self._ids.get(key)
+        if out is not None:
+            self._ids.move_to_end(key)
+            return out
+        target = key.encode('utf-8')
+        prefix, prefixes = key_prefix(target), self._prefixes
+        i = bisect_left(prefixes, prefix)
+        out = []
+        while i < self.n_keys and prefixes[i] == prefix:
+            sid, rid = KEY.unpack_from(self.buf, self.keys_at + i * KEY.size)
+            if self.string_bytes(sid) == target: out.append(rid)
+            i += 1
+        if not out: return ()
+        self._ids[key] = out = tuple(out)
+        if len(self._ids) > IDS_CACHE_SIZE: self._ids.popitem(last=False)
+        return out
+
+    def lookup(self, token):
+        ids = ()
+        for key in normalize_code(token): ids += self.ids(key)
+        return [self.record(i) for i in dict.fromkeys(ids)]
+
+    def lookup_many(self, tokens):
+        """(token, kayıtlar) çiftleri üretir; büyük girdiler için generator."""
+        for token in tokens: yield token, self.lookup(token)
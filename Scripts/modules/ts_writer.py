@@ -0,0 +1,73 @@
+import os
+import json
+import filecmp
+from json.encoder import encode_basestring_ascii
+from .config import OUTPUT_FILE
+
+# data/error-db.ts yazıcısı.
+# Tüm string'ler tek yoldan kodlanır: encode_basestring_ascii (json'un C kodlayıcısı). Çıktı hem geçerli JSON
+# hem geçerli JS string literal'idir; ASCII dışı karakterler ve U+2028/U+2029 \uXXXX olarak kaçışlanır.
+HEADER = "import { ErrorCode } from '../src/types';\n\n// AUTO-GENERATED\nexport const errorDatabase: ErrorCode[] = [\n"
+FOOTER = "\n];\n"
+# Sayfa, public/db/search-index.json'u yalnızca buildId'ler eşleşince kullanır (aynı build'in id sırası).
+BUILD_ID_LINE = "\nexport const buildId: string | null = {};\n"
+BUFFER_SIZE = 1024 * 1024
+
+def js_value(value):
+    if isinstance(value, str): return encode_basestring_ascii(value)
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return "[" + ", ".join(map(encode_basestring_ascii, value)) + "]"
+    return json.dumps(value)
+
+def js_optional(value):
+    return js_value(value) if value else "undefined"
+
+def format_ts_object(obj):
+    # Açıklamalar tek satır gösterilir; satır sonları boşluğa çevrilir.
+    desc = (obj.get('description') or '').replace('\n', ' ')
+    runbook = "undefined"
+    rb = obj.get("runbook")
+    if rb:
+        runbook = f"{{ causes: {js_value(rb.get('causes', []))}, fixCommand: {js_optional(rb.get('fixCommand'))}, deepDive: {js_optional(rb.get('deepDive'))} }}"
+
+    return f"""  {{
+    code: {encode_basestring_ascii(str(obj.get('code')))},
+    codeInt: {obj.get('codeInt', 0)},
+    name: {encode_basestring_ascii(str(obj.get('name')))},
+    description: {encode_basestring_ascii(desc)},
+    platform: {encode_basestring_ascii(str(obj.get('platform', 'windows')))},
+    source: {encode_basestring_ascii(str(obj.get('source', 'Custom')))},
+    solutionHint: {js_optional(obj.get("solutionHint"))},
+    docUrl: {js_optional(obj.get("docUrl"))},
+    severity: {js_value(obj.get("severity", "Error"))},
+    isCommon: {"true" if obj.get("isCommon") else "false"},
+    runbook: {runbook},
+    likelySeenIn: {js_value(obj.get("likelySeenIn", []))},
+    products: {js_value(obj.get("products", []))}
+  }}"""
+
+def write_ts(records, path=OUTPUT_FILE, build_id=None):
+    """
+    Kayıtları tek tek kodlayıp tamponlu dosyaya yazar; bellekte tüm çıktı hiç birikmez.
+    Önce <path>.tmp yazılır ve os.replace ile yerine konur, site yarım dosya görmez.
+    İçerik değişmediyse mevcut dosyaya dokunulmaz (mtime korunur). Yazılan kayıt sayısını döndürür.
+    """
+    tmp = path + ".tmp"
+    count = 0
+    try:
+        with open(tmp, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+            f.write(HEADER)
+            for obj in records:
+                if count: f.write(",\n")
+                f.write(format_ts_object(obj))
+                count += 1
+            f.write(FOOTER)
+            f.write(BUILD_ID_LINE.format(json.dumps(build_id)))
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path) and filecmp.cmp(tmp, path, shallow=False): os.remove(tmp)
+        else: os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp): os.remove(tmp)
+        raise
+    return count
@@ -0,0 +1,54 @@
+import sys
+import os
+import json
+import time
+import argparse
+
+# Modül yolunu ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from modules.scanner import scan_files, SEGMENT_SIZE
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scan log files for error codes and annotate them from the built database.")
+    parser.add_argument("paths", nargs="+", help="Log files or directories (scanned recursively)")
+    parser.add_argument("--db", default=None, help="Built database: error-db.bin snapshot or shard directory (default: data/error-db.bin if built, else public/db)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--segment-mb", type=int, default=SEGMENT_SIZE // (1024 * 1024), help="Split files larger than this into parallel segments")
+    parser.add_argument("--format", choices=["tsv", "json"], default="tsv")
+    parser.add_argument("--summary", action="store_true", help="Print hit counts per code instead of every hit")
+    return parser.parse_args(argv)
+
+def expand_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files): yield os.path.join(root, name)
+        else:
+            yield path
+
+def main(argv=None):
+    args = parse_args(argv)
+    files = sorted(set(expand_paths(args.paths)))
+    total_bytes = sum(os.path.getsize(p) for p in files)
+    out = sys.stdout
+    counts = {}
+    total = 0
+    start = time.perf_counter()
+    for hit in scan_files(files, db=args.db, workers=args.workers, segment_size=args.segment_mb * 1024 * 1024):
+        total += 1
+        if args.summary:
+            key = (hit["code"], hit["platform"], hit["name"], hit["severity"])
+            counts[key] = counts.get(key, 0) + 1
+        elif args.format == "json":
+            out.write(json.dumps(hit, ensure_ascii=False) + "\n")
+        else:
+            out.write(f"{hit['file']}:{hit['line']}\t{hit['token']}\t{hit['code']}\t{hit['platform']}\t{hit['name']}\t{hit['severity']}\t{', '.join(hit['products'])}\n")
+    if args.summary:
+        for (code, platform, name, severity), n in sorted(counts.items(), key=lambda kv: -kv[1]):
+            out.write(f"{n}\t{code}\t{platform}\t{name}\t{severity}\n")
+    elapsed = time.perf_counter() - start
+    mb = total_bytes / (1024 * 1024)
+    print(f"[*] {len(files)} files, {mb:.1f} MB, {total} hits in {elapsed:.2f}s ({mb / elapsed if elapsed else 0:.1f} MB/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import sys
+import os
+import argparse
+
+# Modül yolunu ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from modules.config import SHARD_DIR
+from modules.service import ErrorService, make_server, DEFAULT_CACHE_SIZE
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP lookup service over the built database (/code/<code>, /search?q=, POST /batch).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--db", default=SHARD_DIR, help="Built database directory (public/db)")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="Max cached responses (0 disables the cache)")
+    parser.add_argument("--reload-interval", type=float, default=2.0, help="Seconds between database change checks (0 disables hot reload)")
+    parser.add_argument("--access-log", action="store_true", help="Log every request to stderr")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not os.path.exists(os.path.join(args.db, "manifest.json")): sys.exit(f"{args.db} has no manifest.json; run update_db.py first")
+    service = ErrorService(args.db, cache_size=args.cache_size, reload_interval=args.reload_interval)
+    server = make_server(service, args.host, args.port, quiet=not args.access_log)
+    service.start_watcher()
+    print(f"[*] {len(service.snapshot.records)} records loaded from {args.db}")
+    print(f"[*] Listening on http://{args.host}:{server.server_address[1]}")
+    try: server.serve_forever()
+    except KeyboardInterrupt: pass
+    finally:
+        service.stop()
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
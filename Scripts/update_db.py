@@ -1,36 +1,38 @@
 import sys
 import os
 import json
+import argparse
+import cProfile
 
 # Modül yolunu ekle
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from modules.config import OUTPUT_FILE, CUSTOM_FILE
+from modules.config import OUTPUT_FILE, SNAPSHOT_FILE, FUZZY_INDEX_FILE, CUSTOM_FILE, COLLISION_REPORT, BUILD_REPORT, CACHE_DIR, BUILD_CACHE_DIR, SHARD_DIR, FETCH_WORKERS
 from modules.static_data import STATIC_DATA
-from modules.enrichment import determine_products, generate_doc_url, determine_severity, format_ts_object, to_unsigned_hex
-from modules.scrapers import fetch_bsod, fetch_windows_headers, fetch_postgres, fetch_standards, fetch_kubernetes
+from modules.enrichment import enrich_records, to_unsigned_hex
+from modules.fetcher import configure, prefetch, unavailable, STATS as FETCH_STATS
+from modules.scrapers import SOURCES
+from modules.build_cache import BuildCache, digest, file_digest, records_digest
+from modules.record_store import RecordStore
+from modules.build_report import BuildReport
+
+class SourcesUnavailable(Exception):
+    """Bir kaynak indirilemedi ve önbellekte kopyası yok: çıktılar eksik veriyle yazılmaz."""
 
 def load_custom_data():
     if not os.path.exists(CUSTOM_FILE): return {}
     with open(CUSTOM_FILE, 'r', encoding='utf-8') as f: return json.load(f)
 
-def main():
-    print("[*] ORCHESTRATOR STARTED: Building Error Database...")
-    
-    all_errors = {}
-    
-    # 1. Fetching Phase
-    print("[-] Phase 1: Scraping Data...")
-    all_errors.update(fetch_bsod())
-    all_errors.update(fetch_windows_headers())
-    all_errors.update(fetch_postgres())
-    all_errors.update(fetch_standards())
-    all_errors.update(fetch_kubernetes()) # NEW
-    
-    print(f"    -> Total so far: {len(all_errors)}")
-    
-    # 2. Merging Static Data
-    print("[-] Phase 2: Applying Premium Data...")
+def write_collision_report(store, path=COLLISION_REPORT):
+    report = store.collision_report()
+    with open(path, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"    -> Collisions: {len(report['overwritten'])} overwritten, {len(report['sharedCodes'])} codes shared across platforms ({os.path.basename(path)})")
+    for item in report["overwritten"][:5]:
+        print(f"       [!] {item['platform']}:{item['code']} {item['replaced']['via']}/{item['replaced']['name']} -> {item['kept']['via']}/{item['kept']['name']}")
+
+def apply_static_data(store):
+    """STATIC_DATA'daki premium kayıtları uygular; dokunulan anahtarları döndürür."""
+    keys = []
     for k, v in STATIC_DATA.items():
         for c, d in v.items():
             if k == "windows":
@@ -45,10 +47,11 @@ def main():
                 code_key = c
                 src_label = "Official Docs"
             
-            if code_key not in all_errors:
-                all_errors[code_key] = {"code": code_key, "codeInt": 0, "platform": k, "likelySeenIn": [], "products": []}
+            key = store.key(k, code_key)
+            if key not in store:
+                store.add({"code": code_key, "codeInt": 0, "platform": k, "likelySeenIn": [], "products": []}, "static")
             
-            all_errors[code_key].update({
+            store[key].update({
                 "codeInt": int(c, 16) if c.startswith("0x") else int(c) if c.isdigit() else 0,
                 "name": d["name"],
                 "description": d["desc"],
@@ -57,30 +60,150 @@ def main():
                 "solutionHint": d.get("solutionHint"),
                 "isCommon": d.get("isCommon", False)
             })
-            if "likelySeenIn" in d: all_errors[code_key]["likelySeenIn"] = d["likelySeenIn"]
+            if "likelySeenIn" in d: store[key]["likelySeenIn"] = d["likelySeenIn"]
+            keys.append(key)
+    return keys
 
-    # 3. Merging Custom User Data
+def apply_custom_data(store):
+    """
+    custom-knowledge.json girdilerini uygular. Platform belirtilmezse önce kodu birebir aynı yazılmış kayda
+    (0x0000007b -> bsod), sonra aynı değerdeki windows kaydına (0x000006be -> 0x6be), yoksa aynı koddaki ilk kayda.
+    """
+    keys = []
     custom_data = load_custom_data()
     for c, d in custom_data.items():
         cl = c.lower()
-        if cl not in all_errors: 
-            all_errors[cl] = {"code": cl, "codeInt": 0, "name": "CUSTOM", "description": "", "platform": "windows", "source": "Custom"}
-        all_errors[cl].update(d)
+        platform = d.get("platform")
+        if not platform:
+            matches = store.find(cl)
+            exact = [obj for obj in matches if str(obj.get("code", "")).lower() == cl]
+            platform = exact[0]["platform"] if exact else "windows" if store.get("windows", cl) or not matches else matches[0]["platform"]
+        key = store.key(platform, cl)
+        if key not in store:
+            store.add({"code": cl, "codeInt": 0, "name": "CUSTOM", "description": "", "platform": platform, "source": "Custom"}, "custom")
+        store[key].update(d)
+        keys.append(key)
+    return keys
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Builds data/error-db.ts from upstream sources.")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS, help="Max concurrent downloads")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Source cache directory (also accepts a fixture directory of <KEY>.body files)")
+    parser.add_argument("--offline", action="store_true", help="Rebuild from the source cache only, without network access")
+    parser.add_argument("--full", action="store_true", help="Ignore the incremental build cache and re-parse every source")
+    parser.add_argument("--report", default=BUILD_REPORT, help="Where to write the JSON build report")
+    parser.add_argument("--profile", metavar="PATH", help="Run under cProfile and dump pstats to PATH")
+    parser.add_argument("--trace-memory", action="store_true", help="Record per-phase peak memory with tracemalloc (slower)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = BuildReport(args, trace_memory=args.trace_memory)
+    profiler = cProfile.Profile() if args.profile else None
+    error = None
+    if profiler: profiler.enable()
+    try: build(args, report)
+    except SourcesUnavailable as e:
+        error = e
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        report.finish(FETCH_STATS, error)
+        report.write(args.report)
+        print(report.summary())
+        print(f"    -> Build report: {args.report}" + (f", profile: {args.profile}" if profiler else ""))
+    if error is not None: sys.exit(f"[!] FAILED: {error}")
+
+def build(args, report):
+    configure(cache_dir=args.cache_dir, offline=args.offline, workers=args.workers)
+    print("[*] ORCHESTRATOR STARTED: Building Error Database..." + (" (offline)" if args.offline else ""))
+    
+    all_errors = RecordStore()
+    with report.phase("setup"):
+        cache = BuildCache(BUILD_CACHE_DIR, enabled=not args.full)
+    
+    # 1. Fetching Phase
+    print("[-] Phase 1: Scraping Data...")
+    # Tüm indirmeler paralel; parse ve birleştirme SOURCES sırasıyla yapılır.
+    with report.phase("download"):
+        prefetch([key for _, _, keys in SOURCES for key in keys])
+    source_hashes = []
+    with report.phase("sources"):
+        for name, fetcher, keys in SOURCES:
+            with report.source(name, keys) as entry:
+                source_hash = cache.source_digest(keys)
+                source_hashes.append(source_hash)
+                records = cache.load(name, source_hash)
+                if records is None:
+                    # Değişen kaynak: parse + zenginleştirme sadece burada çalışır.
+                    with report.timed(entry, "parseSeconds"): records = fetcher()
+                    with report.timed(entry, "enrichSeconds"): enrich_records(records)
+                    with report.timed(entry, "cacheSeconds"): cache.store(name, source_hash, records)
+                else:
+                    entry["cached"] = True
+                    print(f"    [=] {name}: unchanged, {len(records)} cached records")
+                entry["parsed"] = len(records)
+                for obj in records: all_errors.add(obj, name)
+    
+    print(f"    -> Total so far: {len(all_errors)}")
+    missing = unavailable([key for _, _, keys in SOURCES for key in keys])
+    if missing:
+        raise SourcesUnavailable(f"no data for {', '.join(missing)} (download failed, nothing cached); outputs left untouched")
+    
+    inputs_hash = None
+    if None not in source_hashes:
+        inputs_hash = digest(*source_hashes, json.dumps(STATIC_DATA, sort_keys=True), file_digest(CUSTOM_FILE))
+    outputs = [OUTPUT_FILE, SNAPSHOT_FILE, os.path.join(SHARD_DIR, "manifest.json"), os.path.join(SHARD_DIR, "search-index.json"), FUZZY_INDEX_FILE]
+    if inputs_hash and cache.is_up_to_date(inputs_hash, outputs):
+        report.add_overwrites(all_errors.overwrites)
+        report.counts["records"] = len(all_errors)
+        report.data["upToDate"] = True
+        print("[+] SUCCESS: No input changed, database is up to date.")
+        return
+    # 2-3. Merging Static Data + Custom User Data
+    print("[-] Phase 2: Applying Premium Data...")
+    with report.phase("merge-static"): overlay_keys = apply_static_data(all_errors)
+    with report.phase("merge-custom"): overlay_keys += apply_custom_data(all_errors)
+    report.add_overwrites(all_errors.overwrites)
+    write_collision_report(all_errors)
 
     # 4. Enrichment & Tagging
+    # Kaynak kayıtları Phase 1'de zenginleştirildi; sadece static/custom ile değişenler yeniden hesaplanır.
     print("[-] Phase 3: Enriching Data...")
-    for obj in all_errors.values():
-        obj["products"] = determine_products(obj.get("code"), obj.get("name"), obj.get("likelySeenIn"), obj.get("platform", "windows"))
-        obj["docUrl"] = generate_doc_url(obj.get("code"), obj.get("platform"), obj.get("name"))
-        obj["severity"] = determine_severity(obj.get("code"), obj.get("name"), obj.get("platform"))
+    with report.phase("enrich"):
+        enrich_records([all_errors[key] for key in dict.fromkeys(overlay_keys)])
 
-    # 5. Output
+    # 5. Output (yazıcılar sadece gerçekten build edilirken yüklenir)
+    from modules.ts_writer import write_ts
+    from modules.snapshot import write_snapshot
+    from modules.shards import write_shards
+    from modules.search_index import write_search_index, SEARCH_FIELDS
+    from modules.fuzzy_index import write_fuzzy_index, FUZZY_FIELDS
     print(f"[-] Phase 4: Writing {len(all_errors)} records to file...")
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write("import { ErrorCode } from '../src/types';\n\n// AUTO-GENERATED\nexport const errorDatabase: ErrorCode[] = [\n")
-        f.write(",\n".join([format_ts_object(obj) for obj in all_errors.values()]))
-        f.write("\n];\n")
+    records = list(all_errors.values())
+    # İndeksler kayıtların birkaç alanından türer; o alanlar değişmediyse (ör. sadece solutionHint) yeniden yazılmaz.
+    # buildId arama indeksinin anahtarıdır: error-db.ts, manifest.json ve search-index.json aynı kimliği taşıyorsa birbirine uyar.
+    search_hash, fuzzy_hash = records_digest(records, SEARCH_FIELDS), records_digest(records, FUZZY_FIELDS)
+    build_id = search_hash
+    with report.phase("write-ts"): write_ts(records, OUTPUT_FILE, build_id)
+    with report.phase("write-snapshot"): write_snapshot(records, SNAPSHOT_FILE)
+    with report.phase("write-shards"): write_shards(records, SHARD_DIR, build_id)
+    written = []
+    with report.phase("write-fuzzy-index"):
+        if not cache.is_current("fuzzy-index", fuzzy_hash, FUZZY_INDEX_FILE): write_fuzzy_index(records, FUZZY_INDEX_FILE); written.append("fuzzy")
+        cache.mark("fuzzy-index", fuzzy_hash)
+    with report.phase("write-search-index"):  # en son: servis bu dosyayı izler
+        if not cache.is_current("search-index", search_hash, os.path.join(SHARD_DIR, "search-index.json")): write_search_index(records, SHARD_DIR, build_id); written.append("search")
+        cache.mark("search-index", search_hash)
+    print(f"    -> Compact shards written to {SHARD_DIR}; indexes rewritten: {', '.join(written) or 'none (indexed fields unchanged)'}")
+    report.counts.update(records=len(all_errors), overwritten=len(all_errors.overwrites), overlays=len(set(overlay_keys)))
+    report.add_outputs(outputs)
     
+    if inputs_hash: cache.save(inputs_hash, outputs)
     print("[+] SUCCESS: Database build complete.")
 
 if __name__ == "__main__":
@@ -1,8 +1,14 @@
 "use client";
 
-import { useMemo, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import { ErrorCode } from "@/src/types";
-import { errorDatabase } from "@/data/error-db";
+import { buildId, errorDatabase } from "@/data/error-db";
+import {
+  SearchIndex,
+  candidateIds,
+  codeIds,
+  loadSearchIndex,
+} from "@/src/lib/search-index";
 import type { ReactNode } from "react";
 import {
   LayoutGrid,
@@ -37,6 +43,24 @@ export default function Home() {
     useState<SelectedPlatform>("all");
   const [copiedCode, setCopiedCode] = useState<string | null>(null);
   const [copiedFixFor, setCopiedFixFor] = useState<string | null>(null);
+  const [searchIndex, setSearchIndex] = useState<SearchIndex | null>(null);
+  useEffect(() => {
+    let alive = true;
+    loadSearchIndex().then((index) => {
+      // Farklı bir build'den gelen indeks id'leri kaydırır; o durumda tam taramada kal.
+      if (
+        alive &&
+        index &&
+        buildId !== null &&
+        index.buildId === buildId &&
+        index.total === errorDatabase.length
+      )
+        setSearchIndex(index);
+    });
+    return () => {
+      alive = false;
+    };
+  }, []);
   const PLATFORMS: Array<{
     id: SelectedPlatform;
     label: string;
@@ -85,35 +109,48 @@ export default function Home() {
   const matched: ErrorCode[] = useMemo(() => {
     const list = errorDatabase as unknown as ErrorCode[];
     const term = searchTerm.trim().toLowerCase();
-    return list
-      .filter((e) => {
-        if (selectedPlatform !== "all") {
-          if (selectedPlatform === "sccm") {
-            const code = (e.code || "").toLowerCase();
-            const src = (e.source || "").toLowerCase();
-            const prods = Array.isArray(e.products) ? e.products : [];
-            const isSccmish =
-              e.platform === "sccm" ||
-              src === "sccm" ||
-              prods.includes("Windows Update") ||
-              prods.includes("DISM/CBS") ||
-              code.startsWith("0x800f") ||
-              code.startsWith("0x8024");
-            if (!isSccmish) return false;
-          } else {
-            if (e.platform !== selectedPlatform) return false;
-          }
-        }
-        if (term) {
-          return (
-            e.code.toLowerCase().includes(term) ||
-            String(e.codeInt).toLowerCase().includes(term) ||
-            e.name.toLowerCase().includes(term) ||
-            e.description.toLowerCase().includes(term)
-          );
+    // Alt-string filtresinin göremediği kod biçimleri (signed/unsigned onluk, dolgulu hex) birebir eşleşir.
+    const exact = new Set<ErrorCode>(
+      searchIndex && term ? codeIds(searchIndex, term).map((id) => list[id]) : []
+    );
+    const keep = (e: ErrorCode) => {
+      if (selectedPlatform !== "all") {
+        if (selectedPlatform === "sccm") {
+          const code = (e.code || "").toLowerCase();
+          const src = (e.source || "").toLowerCase();
+          const prods = Array.isArray(e.products) ? e.products : [];
+          const isSccmish =
+            e.platform === "sccm" ||
+            src === "sccm" ||
+            prods.includes("Windows Update") ||
+            prods.includes("DISM/CBS") ||
+            code.startsWith("0x800f") ||
+            code.startsWith("0x8024");
+          if (!isSccmish) return false;
+        } else {
+          if (e.platform !== selectedPlatform) return false;
         }
-        return true;
-      })
+      }
+      if (term) {
+        return (
+          exact.has(e) ||
+          e.code.toLowerCase().includes(term) ||
+          String(e.codeInt).toLowerCase().includes(term) ||
+          e.name.toLowerCase().includes(term) ||
+          e.description.toLowerCase().includes(term)
+        );
+      }
+      return true;
+    };
+    if (searchIndex) {
+      // İndeks sıralı id listesi verir: tarama ve sort gerekmez.
+      const ids = (term && candidateIds(searchIndex, term)) || searchIndex.order;
+      const out: ErrorCode[] = [];
+      for (const id of ids) if (keep(list[id])) out.push(list[id]);
+      return out;
+    }
+    return list
+      .filter(keep)
       .sort((a, b) => {
         if (a.isCommon && !b.isCommon) return -1;
         if (!a.isCommon && b.isCommon) return 1;
@@ -124,7 +161,7 @@ export default function Home() {
         if (byName !== 0) return byName;
         return a.code.localeCompare(b.code, undefined, { numeric: true });
       });
-  }, [searchTerm, selectedPlatform]);
+  }, [searchTerm, selectedPlatform, searchIndex]);
   const limited: ErrorCode[] = useMemo(() => matched.slice(0, 50), [matched]);
   const isLimited = matched.length > 50;
   const platformAccent = (p: SelectedPlatform) => {
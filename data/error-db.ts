@@ -141123,3 +141123,5 @@ export const errorDatabase: ErrorCode[] = [
     products: ["System"]
   }
 ];
+
+export const buildId: string | null = null;
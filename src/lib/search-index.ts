@@ -0,0 +1,101 @@
+// Scripts/modules/search_index.py ile üretilen arama indeksinin okuyucusu (public/db/search-index.json).
+export interface SearchIndex {
+  version: number;
+  buildId: string | null; // data/error-db.ts'teki buildId ile aynıysa id'ler bu build'e aittir
+  total: number;
+  gram: number;
+  order: number[]; // rank position -> record id (errorDatabase index)
+  grams: Record<string, number[]>; // delta-encoded rank positions
+  codes: Record<string, number[]>; // extra code forms (signed/unsigned decimal, padded/unpadded hex) -> rank positions
+}
+
+export const DEFAULT_INDEX_URL = "/error-code-explorer/db/search-index.json";
+
+export async function loadSearchIndex(
+  url: string = DEFAULT_INDEX_URL
+): Promise<SearchIndex | null> {
+  try {
+    const res = await fetch(url);
+    if (!res.ok) return null;
+    return await res.json();
+  } catch {
+    return null;
+  }
+}
+
+const decoded = new WeakMap<number[], Int32Array>();
+const postings = (list: number[]): Int32Array => {
+  let out = decoded.get(list);
+  if (!out) {
+    out = new Int32Array(list.length);
+    let acc = 0;
+    for (let i = 0; i < list.length; i++) out[i] = acc += list[i];
+    decoded.set(list, out);
+  }
+  return out;
+};
+
+const intersect = (a: Int32Array, b: Int32Array): Int32Array => {
+  const out = new Int32Array(Math.min(a.length, b.length));
+  let i = 0,
+    j = 0,
+    n = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] < b[j]) i++;
+    else if (a[i] > b[j]) j++;
+    else {
+      out[n++] = a[i];
+      i++;
+      j++;
+    }
+  }
+  return out.subarray(0, n);
+};
+
+const union = (a: Int32Array, b: Int32Array): Int32Array => {
+  const out = new Int32Array(a.length + b.length);
+  let i = 0,
+    j = 0,
+    n = 0;
+  while (i < a.length || j < b.length) {
+    if (j >= b.length || (i < a.length && a[i] < b[j])) out[n++] = a[i++];
+    else if (i >= a.length || a[i] > b[j]) out[n++] = b[j++];
+    else {
+      out[n++] = a[i];
+      i++;
+      j++;
+    }
+  }
+  return out.subarray(0, n);
+};
+
+// Terimle birebir eşleşen ek kod biçimlerinin kayıt id'leri (ör. 0x80070005 için -2147024891).
+// Bu kayıtlar alan filtresinden geçmez; çağıran taraf onları doğrudan kabul eder.
+export function codeIds(index: SearchIndex, term: string): number[] {
+  const list = index.codes[term.trim().toLowerCase()];
+  return list ? list.map((pos) => index.order[pos]) : [];
+}
+
+// Terimin tüm trigramlarını içeren ya da kod biçimi terime eşit kayıt id'leri, sıra düzeninde.
+// Trigramdan kısa terimler için null döner (çağıran taraf sıralı tam taramaya düşer).
+// Sonuç adaydır: çağıran taraf asıl alan eşleşmesini (ya da codeIds) yine doğrular.
+export function candidateIds(index: SearchIndex, term: string): number[] | null {
+  const t = term.toLowerCase();
+  if (t.length < index.gram) return null;
+  const lists: Int32Array[] = [];
+  let missing = false;
+  for (let i = 0; i + index.gram <= t.length && !missing; i++) {
+    const list = index.grams[t.slice(i, i + index.gram)];
+    if (list) lists.push(postings(list));
+    else missing = true;
+  }
+  let acc = new Int32Array(0);
+  if (!missing) {
+    lists.sort((a, b) => a.length - b.length);
+    acc = lists[0];
+    for (let k = 1; k < lists.length && acc.length; k++) acc = intersect(acc, lists[k]);
+  }
+  const exact = index.codes[t.trim()];
+  if (exact) acc = union(acc, Int32Array.from(exact));
+  return Array.from(acc, (pos) => index.order[pos]);
+}